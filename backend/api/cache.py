@@ -0,0 +1,112 @@
+"""
+In-process response cache for read-mostly API endpoints.
+
+Job data only changes when the scraper runs or an admin edits a job. Both
+bump a single-row data version (see DataVersion), and cached results are
+only served while the version they were computed at is still current. The
+version is read at most once per DATA_VERSION_POLL_INTERVAL seconds, so a
+cache hit normally needs no database connection at all. Entries also
+expire after API_CACHE_TTL seconds, and the least recently used entries are
+evicted beyond API_CACHE_SIZE.
+
+    stats = await response_cache.get_or_compute("stats", db, lambda: compute_stats(db))
+
+Configuration (environment):
+    API_CACHE_TTL                  seconds a cached result is served (default 300)
+    API_CACHE_SIZE                 cached results kept (default 256)
+    DATA_VERSION_POLL_INTERVAL     seconds between data version reads (default 5)
+"""
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from api.models import DataVersion
+
+API_CACHE_TTL = float(os.getenv("API_CACHE_TTL", "300"))
+API_CACHE_SIZE = int(os.getenv("API_CACHE_SIZE", "256"))
+DATA_VERSION_POLL_INTERVAL = float(os.getenv("DATA_VERSION_POLL_INTERVAL", "5"))
+
+T = TypeVar("T")
+
+
+async def read_data_version(db) -> int:
+    """Current data version (0 before the first bump)."""
+    version = await db.scalar(select(DataVersion.version).where(DataVersion.id == 1))
+    return version or 0
+
+
+async def bump_data_version(db) -> None:
+    """
+    Mark job data as changed. Runs in the caller's transaction (a session or
+    connection); the caller commits.
+    """
+    stmt = pg_insert(DataVersion).values(id=1, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DataVersion.id],
+        set_={"version": DataVersion.version + 1, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
+
+
+class ResponseCache:
+    """TTL + LRU cache whose entries are tied to the data version."""
+
+    def __init__(
+        self,
+        maxsize: int = API_CACHE_SIZE,
+        ttl: float = API_CACHE_TTL,
+        poll_interval: float = DATA_VERSION_POLL_INTERVAL,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.poll_interval = poll_interval
+        # key -> (data version, expiry on the monotonic clock, value)
+        self._entries: OrderedDict[Hashable, tuple[int, float, Any]] = OrderedDict()
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def data_version(self, db) -> int:
+        """The data version, read from the database at most once per poll interval."""
+        if self._version is not None and time.monotonic() - self._checked_at < self.poll_interval:
+            return self._version
+        async with self._lock:
+            # Another request may have refreshed it while we waited
+            if self._version is None or time.monotonic() - self._checked_at >= self.poll_interval:
+                self._version = await read_data_version(db)
+                self._checked_at = time.monotonic()
+        return self._version
+
+    def observe_version(self, version: int) -> None:
+        """Record a data version just read elsewhere, restarting the poll interval."""
+        self._version = version
+        self._checked_at = time.monotonic()
+
+    async def get_or_compute(self, key: Hashable, db, compute: Callable[[], Awaitable[T]]) -> T:
+        """Cached value for `key`, or the result of `compute()` (then cached)."""
+        version = await self.data_version(db)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and entry[1] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[2]
+
+        value = await compute()
+        self._entries[key] = (version, time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every entry and re-read the data version on the next request."""
+        self._entries.clear()
+        self._checked_at = 0.0
+
+
+# Process-wide cache shared by the API routes
+response_cache = ResponseCache()
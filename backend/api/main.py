@@ -18,6 +18,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database.connection import init_db, close_db
 from api.routes import jobs_router, subscriptions_router, notifications_router
+from api.middleware import ConditionalGetMiddleware
+
+# Seconds browsers may cache a CORS preflight response
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "86400"))
 
 
 @asynccontextmanager
@@ -45,6 +49,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# ETags, 304s and Cache-Control for the read endpoints (added first, so it
+# runs inside CORS and 304 responses still get CORS headers)
+app.add_middleware(ConditionalGetMiddleware)
+
 # CORS configuration - allow all origins since we don't use credentials
 # This is safe because allow_credentials=False (no cookies/auth headers shared)
 app.add_middleware(
@@ -53,6 +61,7 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Content-Type", "X-API-Key"],
+    max_age=CORS_MAX_AGE,
 )
 
 # Global exception handler for debugging
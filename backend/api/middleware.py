@@ -0,0 +1,136 @@
+"""
+HTTP caching for the public read endpoints.
+
+For GET/HEAD requests to the routes in CACHE_RULES, a weak ETag is derived
+from the data version (see api.cache), read fresh for every conditional
+request, plus the path, query string and deployed commit. Static routes
+use the deployed commit only. A request whose If-None-Match
+matches gets a 304 straight from the middleware, before any route (or
+database query) runs. Successful responses carry the ETag and a
+Cache-Control header that lets browsers and the Vercel edge (which proxies
+/api to this service) serve and revalidate cached copies.
+
+Configuration (environment):
+    API_CACHE_MAX_AGE             seconds browsers/CDN may reuse a response (default 60)
+    API_STALE_WHILE_REVALIDATE    seconds a stale copy may be served while revalidating (default 300)
+    RENDER_GIT_COMMIT             deployed commit, set by Render (part of every ETag;
+                                  without it, ETags only change with the data)
+"""
+import hashlib
+import logging
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.cache import read_data_version, response_cache
+from database.connection import async_session_maker
+
+logger = logging.getLogger(__name__)
+
+API_CACHE_MAX_AGE = int(os.getenv("API_CACHE_MAX_AGE", "60"))
+API_STALE_WHILE_REVALIDATE = int(os.getenv("API_STALE_WHILE_REVALIDATE", "300"))
+
+# Changes on every deploy; the same across workers and restarts of one deploy
+DEPLOY_ID = os.getenv("RENDER_GIT_COMMIT", "")
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    """Caching policy for the paths matching `pattern`."""
+    pattern: re.Pattern
+    max_age: int = API_CACHE_MAX_AGE
+    stale_while_revalidate: int = API_STALE_WHILE_REVALIDATE
+    # ETag from the data version (job data) or only from the deploy (static)
+    versioned: bool = True
+
+    @property
+    def cache_control(self) -> str:
+        return (
+            f"public, max-age={self.max_age}, s-maxage={self.max_age}, "
+            f"stale-while-revalidate={self.stale_while_revalidate}"
+        )
+
+
+CACHE_RULES = [
+    CacheRule(re.compile(r"^/api/jobs/?$")),
+    CacheRule(re.compile(r"^/api/jobs/(companies|stats)$")),
+    CacheRule(re.compile(r"^/api/jobs/\d+$")),
+    CacheRule(re.compile(r"^/api/companies/monitored$"), max_age=3600,
+              stale_while_revalidate=86400, versioned=False),
+]
+
+
+def _match_rule(path: str) -> Optional[CacheRule]:
+    for rule in CACHE_RULES:
+        if rule.pattern.match(path):
+            return rule
+    return None
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against our ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    ours = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == ours for tag in if_none_match.split(","))
+
+
+class ConditionalGetMiddleware:
+    """Weak ETags, 304 responses and Cache-Control for CACHE_RULES routes."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def _etag(self, scope: Scope, rule: CacheRule) -> str:
+        if rule.versioned:
+            # A cached version may lag a bump by the poll interval, which
+            # would 304 changed data; one primary-key SELECT avoids that.
+            # The route then serves from the same version.
+            async with async_session_maker() as db:
+                current = await read_data_version(db)
+            response_cache.observe_version(current)
+            version = str(current)
+        else:
+            version = "static"
+        query = urlencode(sorted(parse_qsl(scope["query_string"].decode("latin-1"))))
+        key = "\x1f".join([DEPLOY_ID, version, scope["path"], query])
+        return f'W/"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        rule = _match_rule(scope["path"])
+        if rule is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            etag = await self._etag(scope, rule)
+        except Exception as e:
+            # Without a version (e.g. database down) serve uncached
+            logger.warning(f"No ETag for {scope['path']}: {e}")
+            await self.app(scope, receive, send)
+            return
+
+        cache_headers = {"ETag": etag, "Cache-Control": rule.cache_control}
+        if _etag_matches(Headers(scope=scope).get("if-none-match"), etag):
+            await Response(status_code=304, headers=cache_headers)(scope, receive, send)
+            return
+
+        async def send_with_validators(message: Message) -> None:
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                for name, value in cache_headers.items():
+                    headers[name] = value
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
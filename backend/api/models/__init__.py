@@ -1,4 +1,6 @@
 from .job import Job, JobBase, JobCreate, JobUpdate, JobResponse, JobListResponse
+from .data_version import DataVersion
+from .job_rollup import JobRollup
 from .subscription import (
     Subscription,
     NotificationLog,
@@ -17,6 +19,8 @@ __all__ = [
     "JobUpdate",
     "JobResponse",
     "JobListResponse",
+    "DataVersion",
+    "JobRollup",
     "Subscription",
     "NotificationLog",
     "SubscriptionBase",
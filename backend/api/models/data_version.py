@@ -0,0 +1,16 @@
+"""
+Data version stamp for cached API responses.
+"""
+from sqlalchemy import Column, Integer, BigInteger, DateTime
+from sqlalchemy.sql import func
+from database.connection import Base
+
+
+class DataVersion(Base):
+    """Single-row counter bumped whenever job data changes (scraper runs, admin writes)."""
+
+    __tablename__ = "data_version"
+
+    id = Column(Integer, primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
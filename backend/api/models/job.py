@@ -1,9 +1,11 @@
 """
 Job listing database model.
 """
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, Date, ARRAY
+from sqlalchemy import Column, Computed, Index, Integer, String, Text, Boolean, DateTime, Date, ARRAY
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
-from database.connection import Base
+from database.connection import Base, JOB_SEARCH_VECTOR_SQL
 from pydantic import BaseModel, Field
 from datetime import datetime, date
 from typing import Optional
@@ -28,8 +30,29 @@ class Job(Base):
     salary_range = Column(String(100), nullable=True)
     tags = Column(ARRAY(String), default=[])
     is_active = Column(Boolean, default=True)
+    source = Column(String(100), nullable=True, index=True)  # Scraper that found the job
+    last_seen_at = Column(DateTime(timezone=True), nullable=True)  # Last run that saw the job
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Full-text search document, maintained by Postgres (not loaded with the row)
+    search_vector = deferred(Column(TSVECTOR, Computed(JOB_SEARCH_VECTOR_SQL, persisted=True)))
+
+    __table_args__ = (
+        Index("ix_jobs_search_vector", search_vector, postgresql_using="gin"),
+        # Job list order (newest first) and its keyset cursor
+        Index("ix_jobs_active_created", is_active, created_at.desc(), id.desc()),
+        # Title substring search (ILIKE '%...%'), where pg_trgm is installed
+        Index(
+            "ix_jobs_title_trgm", title,
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(callable_=lambda ddl, target, bind, **kw: _has_pg_trgm(bind)),
+    )
+
+
+def _has_pg_trgm(bind) -> bool:
+    return bind is not None and bind.exec_driver_sql(
+        "SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'"
+    ).first() is not None
 
 
 # Pydantic schemas
@@ -77,6 +100,8 @@ class JobResponse(JobBase):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    # Highlighted excerpt matching the search (only with ?search=...&highlight=true)
+    snippet: Optional[str] = None
 
     class Config:
         from_attributes = True
@@ -85,7 +110,12 @@ class JobResponse(JobBase):
 class JobListResponse(BaseModel):
     """Schema for paginated job list."""
     jobs: list[JobResponse]
-    total: int
+    # None on cursor pages unless include_total was requested
+    total: Optional[int] = None
     page: int
     per_page: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    # Opaque cursor for the next page (None on the last page)
+    next_cursor: Optional[str] = None
+    # False when `total` is the planner's estimate rather than a count
+    total_exact: bool = True
@@ -0,0 +1,21 @@
+"""
+Job count rollups, maintained at ingest time.
+"""
+from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy.sql import func
+from database.connection import Base
+
+
+class JobRollup(Base):
+    """
+    Active job count for one value of a dimension (company, experience_level,
+    job_type, tag, or the overall total). Rebuilt by api.rollups whenever jobs
+    are written, so the dashboard reads a handful of rows.
+    """
+
+    __tablename__ = "job_rollups"
+
+    dimension = Column(String(30), primary_key=True)
+    value = Column(Text, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,67 @@
+"""
+Job count rollups for the stats and companies endpoints.
+
+Counting active jobs per company, experience level, job type and tag is
+done when jobs are written (the scraper's ingest step and the admin job
+endpoints), not when the dashboard is read. refresh_job_rollups() rebuilds
+the job_rollups table in the writer's transaction, so readers see either
+the old or the new counts, and the endpoints read a few rows in one query
+however large the jobs table grows.
+"""
+from sqlalchemy import delete, distinct, func, insert, literal, select, text, union_all
+
+from api.models import Job, JobRollup
+
+# Label for jobs without an experience level / job type
+NOT_SPECIFIED = "Not Specified"
+
+# Serializes concurrent refreshes (scraper and admin writes)
+ROLLUP_LOCK_ID = 0x6A6F6273  # "jobs"
+
+
+def _rollup_query():
+    """One (dimension, value, count) row per active value of each dimension."""
+    active = Job.is_active == True
+    experience_level = func.coalesce(Job.experience_level, NOT_SPECIFIED)
+    job_type = func.coalesce(Job.job_type, NOT_SPECIFIED)
+    tags = select(Job.id, func.unnest(Job.tags).label("tag")).where(active).subquery()
+
+    return union_all(
+        select(literal("total"), literal(""), func.count()).where(active),
+        select(literal("company"), Job.company, func.count()).where(active).group_by(Job.company),
+        select(literal("experience_level"), experience_level, func.count())
+        .where(active).group_by(experience_level),
+        select(literal("job_type"), job_type, func.count()).where(active).group_by(job_type),
+        select(literal("tag"), tags.c.tag, func.count(distinct(tags.c.id)))
+        .where(tags.c.tag.is_not(None)).group_by(tags.c.tag),
+    )
+
+
+async def refresh_job_rollups(db) -> None:
+    """
+    Rebuild the rollups from the jobs table. Runs in the caller's transaction
+    (a session or connection); the caller commits.
+    """
+    await db.execute(text("SELECT pg_advisory_xact_lock(:id)"), {"id": ROLLUP_LOCK_ID})
+    await db.execute(delete(JobRollup))
+    await db.execute(
+        insert(JobRollup).from_select(["dimension", "value", "count"], _rollup_query())
+    )
+
+
+async def read_job_rollups(db) -> dict[str, dict[str, int]]:
+    """All rollups as {dimension: {value: count}}, largest counts first."""
+    result = await db.execute(
+        select(JobRollup.dimension, JobRollup.value, JobRollup.count)
+        .order_by(JobRollup.dimension, JobRollup.count.desc(), JobRollup.value)
+    )
+    rows = result.all()
+    if not rows:
+        # Never refreshed (e.g. a new database): build the rollups once
+        await refresh_job_rollups(db)
+        return await read_job_rollups(db)
+
+    rollups: dict[str, dict[str, int]] = {}
+    for dimension, value, count in rows:
+        rollups.setdefault(dimension, {})[value] = count
+    return rollups
@@ -3,29 +3,58 @@ Job-related API routes.
 """
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_
+from sqlalchemy import select, func, literal_column, or_, tuple_
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from datetime import datetime
 from typing import Optional
+import base64
+import json
 from database.connection import get_db
+from api.cache import response_cache, bump_data_version
+from api.rollups import read_job_rollups, refresh_job_rollups
 from api.dependencies import require_admin_key
 from api.models import Job, JobCreate, JobUpdate, JobResponse, JobListResponse
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+# Text search configuration used for Job.search_vector (see database.connection)
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+# ts_headline options for search snippets
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=30, MinWords=10, StartSel=<mark>, StopSel=</mark>"
+
 
 @router.get("/", response_model=JobListResponse)
 async def get_jobs(
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     company: Optional[str] = None,
     search: Optional[str] = None,
     experience_level: Optional[str] = None,
     job_type: Optional[str] = None,
     is_active: bool = True,
+    highlight: bool = False,
+    include_total: bool = False,
     db: AsyncSession = Depends(get_db),
 ):
     """
     Get paginated list of job listings with optional filters.
+
+    `search` is a web-style query ("senior .net", "react -native", quoted
+    phrases) matched against the full-text index, or a substring of the
+    title, and ordered by relevance.
+    With `highlight`, each job carries a snippet of the matching text.
+
+    Pages are addressed by `page`, or by the `next_cursor` of the previous
+    response (`cursor` takes precedence). Newest-first listings use keyset
+    pagination on (created_at, id), so deep pages cost the same as the
+    first. `total` is exact with `include_total` or when the whole result
+    fits in the returned pages; otherwise it is the planner's estimate
+    (`total_exact` is false). Pages requested by cursor leave `total` unset
+    unless `include_total` is given.
     """
     # Build query
     query = select(Job).where(Job.is_active == is_active)
@@ -34,13 +63,18 @@ async def get_jobs(
     if company:
         query = query.where(Job.company.ilike(f"%{company}%"))
 
+    ts_query = None
     if search:
-        search_filter = or_(
+        ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search)
+        # The parser keeps "ASP.NET" as one token while ".net" becomes "net",
+        # and partial words ("dev") match no lexeme, so titles are also
+        # matched by substring (ranked after full-text hits). Both sides
+        # are indexed (ix_jobs_search_vector, ix_jobs_title_trgm), so the
+        # planner can combine them with a BitmapOr.
+        query = query.where(or_(
+            Job.search_vector.op("@@")(ts_query),
             Job.title.ilike(f"%{search}%"),
-            Job.description.ilike(f"%{search}%"),
-            Job.requirements.ilike(f"%{search}%"),
-        )
-        query = query.where(search_filter)
+        ))
 
     if experience_level:
         query = query.where(Job.experience_level == experience_level)
@@ -48,76 +82,173 @@ async def get_jobs(
     if job_type:
         query = query.where(Job.job_type == job_type)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query) or 0
+    filtered = query
+    position = _decode_cursor(cursor, search=ts_query is not None) if cursor else None
+    keyset = position is not None and ts_query is None
 
-    # Apply pagination
+    # Most relevant first when searching (offset cursor), newest first
+    # otherwise (keyset cursor)
     offset = (page - 1) * per_page
-    query = query.order_by(Job.created_at.desc()).offset(offset).limit(per_page)
+    if ts_query is not None:
+        rank = func.ts_rank_cd(Job.search_vector, ts_query)
+        query = query.order_by(rank.desc(), Job.created_at.desc(), Job.id.desc())
+        if position is not None:
+            offset = position.get("o", 0)
+        query = query.offset(offset)
+    else:
+        query = query.order_by(Job.created_at.desc(), Job.id.desc())
+        if keyset:
+            query = query.where(
+                tuple_(Job.created_at, Job.id) < tuple_(position["c"], position["i"])
+            )
+        else:
+            query = query.offset(offset)
+
+    # One extra row tells whether there is a next page
+    query = query.limit(per_page + 1)
+
+    # Snippets are only computed for the rows of this page
+    with_snippets = ts_query is not None and highlight
+    if with_snippets:
+        document = func.concat_ws(" ", Job.requirements, Job.description)
+        query = query.add_columns(
+            func.ts_headline(SEARCH_CONFIG, document, ts_query, HEADLINE_OPTIONS).label("snippet")
+        )
 
     # Execute query
     result = await db.execute(query)
-    jobs = result.scalars().all()
+    rows = result.all() if with_snippets else [(job, None) for job in result.scalars().all()]
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    jobs = []
+    for job, snippet in rows:
+        response = JobResponse.model_validate(job)
+        response.snippet = snippet
+        jobs.append(response)
+
+    next_cursor = None
+    if has_more:
+        if ts_query is not None:
+            next_cursor = _encode_cursor({"o": offset + per_page})
+        else:
+            last = rows[-1][0]
+            next_cursor = _encode_cursor({"c": last.created_at.isoformat(), "i": last.id})
+
+    # Total: counted when asked for, known from the last page of an offset
+    # listing, estimated by the planner otherwise. Both are cached per
+    # filter set until the data changes. Later cursor pages skip it
+    # (clients keep the first page's total).
+    total_exact = True
+    total_key = (company, search, experience_level, job_type, is_active)
+    if include_total:
+        total = await response_cache.get_or_compute(
+            ("job_total", True, total_key), db, lambda: _count(db, filtered)
+        )
+    elif cursor:
+        total = None
+    elif not has_more and not keyset and (jobs or not offset):
+        total = offset + len(jobs)
+    else:
+        total = await response_cache.get_or_compute(
+            ("job_total", False, total_key), db, lambda: _estimate_count(db, filtered)
+        )
+        total_exact = False
 
-    total_pages = max((total + per_page - 1) // per_page, 1) if total else 0
+    if total is None:
+        total_pages = None
+    else:
+        total_pages = max((total + per_page - 1) // per_page, 1) if total else 0
 
     return JobListResponse(
-        jobs=[JobResponse.model_validate(job) for job in jobs],
+        jobs=jobs,
         total=total,
         page=page,
         per_page=per_page,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+        total_exact=total_exact,
     )
 
 
+def _encode_cursor(position: dict) -> str:
+    """Opaque cursor for a list position."""
+    raw = json.dumps(position, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, search: bool) -> dict:
+    """
+    List position of a cursor: {"o": offset} for search pages,
+    {"c": created_at, "i": id} for keyset pages otherwise. A cursor from
+    the other kind of listing is rejected.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position = json.loads(raw)
+        if search:
+            return {"o": max(int(position["o"]), 0)}
+        return {"c": datetime.fromisoformat(position["c"]), "i": int(position["i"])}
+    except (ValueError, TypeError, KeyError, AttributeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+async def _count(db: AsyncSession, query) -> int:
+    """Exact number of rows matched by a job query."""
+    count_query = select(func.count()).select_from(query.subquery())
+    return await db.scalar(count_query) or 0
+
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executable like any query."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def _estimate_count(db: AsyncSession, query) -> int:
+    """Planner's row estimate for a job query (EXPLAIN, no rows are read)."""
+    plan = await db.scalar(_Explain(query.with_only_columns(Job.id)))
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 @router.get("/companies")
 async def get_companies(db: AsyncSession = Depends(get_db)):
     """Get list of all companies with job counts."""
-    query = (
-        select(Job.company, func.count(Job.id).label("count"))
-        .where(Job.is_active == True)
-        .group_by(Job.company)
-        .order_by(func.count(Job.id).desc())
-    )
-    result = await db.execute(query)
-    companies = result.all()
-
-    return [{"company": c[0], "count": c[1]} for c in companies]
+    rollups = await _rollups(db)
+    return [
+        {"company": company, "count": count}
+        for company, count in rollups.get("company", {}).items()
+    ]
 
 
 @router.get("/stats")
 async def get_stats(db: AsyncSession = Depends(get_db)):
     """Get job statistics."""
-    # Total active jobs
-    total_query = select(func.count(Job.id)).where(Job.is_active == True)
-    total = await db.scalar(total_query)
-
-    # Jobs by company
-    by_company_query = (
-        select(Job.company, func.count(Job.id))
-        .where(Job.is_active == True)
-        .group_by(Job.company)
-    )
-    by_company_result = await db.execute(by_company_query)
-    by_company = {row[0]: row[1] for row in by_company_result.all()}
-
-    # Jobs by experience level
-    by_level_query = (
-        select(Job.experience_level, func.count(Job.id))
-        .where(Job.is_active == True)
-        .group_by(Job.experience_level)
-    )
-    by_level_result = await db.execute(by_level_query)
-    by_level = {row[0] or "Not Specified": row[1] for row in by_level_result.all()}
-
+    rollups = await _rollups(db)
     return {
-        "total_jobs": total,
-        "by_company": by_company,
-        "by_experience_level": by_level,
+        "total_jobs": rollups.get("total", {}).get("", 0),
+        "by_company": rollups.get("company", {}),
+        "by_experience_level": rollups.get("experience_level", {}),
+        "by_job_type": rollups.get("job_type", {}),
+        "by_tag": rollups.get("tag", {}),
     }
 
 
+async def _rollups(db: AsyncSession) -> dict[str, dict[str, int]]:
+    """Active job counts maintained at ingest (see api.rollups), cached."""
+    return await response_cache.get_or_compute("rollups", db, lambda: read_job_rollups(db))
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(job_id: int, db: AsyncSession = Depends(get_db)):
     """Get a specific job by ID."""
@@ -141,10 +272,13 @@ async def create_job(
     job = Job(**job_data.model_dump())
     db.add(job)
     try:
+        await refresh_job_rollups(db)
+        await bump_data_version(db)
         await db.commit()
     except IntegrityError:
         await db.rollback()
         raise HTTPException(status_code=400, detail="Job with this URL already exists")
+    response_cache.invalidate()
     await db.refresh(job)
 
     return JobResponse.model_validate(job)
@@ -169,7 +303,10 @@ async def update_job(
     for field, value in update_data.items():
         setattr(job, field, value)
 
+    await refresh_job_rollups(db)
+    await bump_data_version(db)
     await db.commit()
+    response_cache.invalidate()
     await db.refresh(job)
 
     return JobResponse.model_validate(job)
@@ -190,6 +327,9 @@ async def delete_job(
         raise HTTPException(status_code=404, detail="Job not found")
 
     job.is_active = False
+    await refresh_job_rollups(db)
+    await bump_data_version(db)
     await db.commit()
+    response_cache.invalidate()
 
     return {"message": "Job deactivated successfully"}
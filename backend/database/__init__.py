@@ -1,3 +1,3 @@
-from .connection import Base, engine, get_db, init_db, close_db
+from .connection import Base, engine, get_db, init_db, close_db, run_database
 
-__all__ = ["Base", "engine", "get_db", "init_db", "close_db"]
+__all__ = ["Base", "engine", "get_db", "init_db", "close_db", "run_database"]
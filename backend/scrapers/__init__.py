@@ -1,4 +1,10 @@
 from .base_scraper import BaseScraper
+from .workday_scraper import WorkdayScraper
+from .ats_scraper import ATSScraper
+from .trakstar_scraper import TrakstarScraper
+from .pinpoint_scraper import PinpointScraper
+from .easyjobs_scraper import EasyJobsScraper
+from .wordpress_scraper import WordPressScraper
 from .cefalo_scraper import CefaloScraper
 from .kaz_scraper import KazScraper
 from .selise_scraper import SeliseScraper
@@ -29,6 +35,12 @@ ALL_SCRAPERS = [
 
 __all__ = [
     "BaseScraper",
+    "WorkdayScraper",
+    "ATSScraper",
+    "TrakstarScraper",
+    "PinpointScraper",
+    "EasyJobsScraper",
+    "WordPressScraper",
     "CefaloScraper",
     "KazScraper",
     "SeliseScraper",
@@ -3,9 +3,10 @@ Scraper for a2i (Aspire to Innovate) careers page.
 URL: https://a2i.gov.bd/site/view/jobs/
 """
 from .base_scraper import BaseScraper, JobListing
-from datetime import datetime
+from .dates import extract_dates
+from .keywords import keyword_set
+from typing import AsyncIterator
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -17,34 +18,35 @@ class A2IScraper(BaseScraper):
     BASE_URL = "https://a2i.gov.bd"
     CAREER_URL = "https://a2i.gov.bd/site/view/jobs/-"
     ALT_CAREER_URL = "https://a2i.portal.gov.bd/site/view/jobs/Job-Circular"
-
-    async def scrape(self) -> list[JobListing]:
-        """Scrape job listings from a2i's career page."""
-        jobs = []
-
-        # Try main career page
-        soup = await self.fetch_page(self.CAREER_URL)
-        if soup:
-            jobs.extend(await self._parse_page(soup, self.BASE_URL))
-
-        # Try alternative portal
-        alt_soup = await self.fetch_page(self.ALT_CAREER_URL)
-        if alt_soup:
-            jobs.extend(await self._parse_page(alt_soup, "https://a2i.portal.gov.bd"))
-
-        # Remove duplicates
+    # Header row texts, and words of recruitment-related link texts
+    HEADER_MATCHER = keyword_set(["title", "position", "job"])
+    ROLE_MATCHER = keyword_set([
+        "consultant", "engineer", "developer", "programmer",
+        "officer", "specialist", "intern",
+    ])
+
+    # Large government portal pages; parse them off the event loop
+    PARSE_IN_PROCESS = True
+
+    async def iter_jobs(self) -> AsyncIterator[JobListing]:
+        """Yield job listings from a2i's career pages as each page is parsed."""
+        pages = [
+            (self.CAREER_URL, self.BASE_URL),
+            (self.ALT_CAREER_URL, "https://a2i.portal.gov.bd"),
+        ]
+
+        # Remove duplicates (by title) across both portals
         seen = set()
-        unique_jobs = []
-        for job in jobs:
-            key = job.title
-            if key not in seen:
-                seen.add(key)
-                unique_jobs.append(job)
+        for url, base_url in pages:
+            jobs = await self.scrape_page(url, self._parse_page, base_url)
+            for job in jobs or []:
+                if job.title not in seen:
+                    seen.add(job.title)
+                    yield job
 
-        logger.info(f"Found {len(unique_jobs)} jobs at {self.COMPANY_NAME}")
-        return unique_jobs
+        logger.info(f"Found {len(seen)} jobs at {self.COMPANY_NAME}")
 
-    async def _parse_page(self, soup, base_url: str) -> list[JobListing]:
+    def _parse_page(self, soup, base_url: str) -> list[JobListing]:
         """Parse a2i job page."""
         jobs = []
 
@@ -70,27 +72,15 @@ class A2IScraper(BaseScraper):
                             continue
 
                         # Skip header rows
-                        if any(skip in title.lower() for skip in ["title", "position", "job"]):
+                        if self.HEADER_MATCHER.search(title):
                             continue
 
                         if not href.startswith("http"):
                             href = f"{base_url}{href}"
 
-                        # Extract deadline
-                        deadline = None
-                        cells = row.select("td")
-                        for cell in cells:
-                            text = cell.get_text(strip=True)
-                            date_match = re.search(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', text)
-                            if date_match:
-                                try:
-                                    date_str = date_match.group()
-                                    if "-" in date_str:
-                                        deadline = datetime.strptime(date_str, "%d-%m-%Y")
-                                    else:
-                                        deadline = datetime.strptime(date_str, "%d/%m/%Y")
-                                except ValueError:
-                                    pass
+                        # Extract deadline (the last date column of the row)
+                        dates = extract_dates(cell.get_text(strip=True) for cell in row.select("td"))
+                        deadline = dates[-1] if dates else None
 
                         job = JobListing(
                             company=self.COMPANY_NAME,
@@ -133,13 +123,12 @@ class A2IScraper(BaseScraper):
             # Fallback: find any recruitment-related links
             if not jobs:
                 links = soup.select("a[href]")
-                keywords = ["consultant", "engineer", "developer", "programmer", "officer", "specialist", "intern"]
 
                 for link in links:
                     text = link.get_text(strip=True)
                     href = link.get("href", "")
 
-                    if any(kw in text.lower() for kw in keywords) and len(text) > 10:
+                    if len(text) > 10 and self.ROLE_MATCHER.search(text):
                         if not href.startswith("http"):
                             href = f"{base_url}{href}"
 
@@ -0,0 +1,146 @@
+"""
+Base class for applicant-tracking-system (ATS) adapters.
+
+Boards hosted on an ATS can usually be read several ways (a JSON API, one of
+several REST endpoints, the rendered HTML). Instead of probing them one
+after another on every run, an adapter lists its strategies in priority
+order and:
+
+  * tries the strategy that last worked for the source first, and
+  * otherwise races all strategies concurrently, taking the highest-priority
+    one that returns jobs as soon as every strategy above it has come back
+    empty (so an API is still preferred over HTML scraping).
+
+The winning strategy per source is persisted in the scraper cache directory.
+"""
+from abc import abstractmethod
+from .base_scraper import BaseScraper, JobListing
+from .page_cache import CACHE_DIR
+from typing import Awaitable, Callable, Optional
+import asyncio
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+Strategy = Callable[[], Awaitable[list[JobListing]]]
+
+
+class StrategyMemory:
+    """JSON-file backed map of source -> name of the last strategy that worked."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._choices: Optional[dict[str, str]] = None
+        self._dirty = False
+
+    @property
+    def choices(self) -> dict[str, str]:
+        if self._choices is None:
+            self._choices = self._load()
+        return self._choices
+
+    def _load(self) -> dict[str, str]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return dict(json.load(f))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable strategy cache {self.path}: {e}")
+            return {}
+
+    def get(self, source: str) -> Optional[str]:
+        return self.choices.get(source)
+
+    def remember(self, source: str, strategy: str) -> None:
+        if self.choices.get(source) != strategy:
+            self.choices[source] = strategy
+            self._dirty = True
+
+    def forget(self, source: str) -> None:
+        if self.choices.pop(source, None) is not None:
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the remembered strategies back to disk."""
+        if not self._dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.choices, f, indent=2)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save strategy cache {self.path}: {e}")
+
+
+# Process-wide memory shared by every adapter
+strategy_memory = StrategyMemory(os.path.join(CACHE_DIR, "strategies.json"))
+
+
+class ATSScraper(BaseScraper):
+    """
+    Base scraper for boards that can be read with several strategies.
+    Subclasses implement strategies() and the strategy coroutines.
+    """
+
+    @abstractmethod
+    def strategies(self) -> list[tuple[str, Strategy]]:
+        """(name, coroutine function) pairs in priority order."""
+
+    async def scrape(self) -> list[JobListing]:
+        """Scrape with the remembered strategy, or race all strategies."""
+        strategies = self.strategies()
+        remembered = strategy_memory.get(self.COMPANY_NAME)
+
+        for name, strategy in strategies:
+            if name != remembered:
+                continue
+            jobs = await self._run(name, strategy)
+            if jobs:
+                logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME} via {name}")
+                return jobs
+            logger.info(f"{self.COMPANY_NAME}: remembered strategy {name} found nothing")
+            strategy_memory.forget(self.COMPANY_NAME)
+            strategies = [(n, s) for n, s in strategies if n != name]
+            break
+
+        name, jobs = await self._race(strategies)
+        if jobs:
+            strategy_memory.remember(self.COMPANY_NAME, name)
+            logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME} via {name}")
+        else:
+            logger.warning(f"No jobs found for {self.COMPANY_NAME}")
+        return jobs
+
+    async def _run(self, name: str, strategy: Strategy) -> list[JobListing]:
+        """Run one strategy; failures count as an empty result."""
+        try:
+            return await strategy() or []
+        except Exception as e:
+            logger.debug(f"{self.COMPANY_NAME}: strategy {name} failed: {e}")
+            return []
+
+    async def _race(self, strategies: list[tuple[str, Strategy]]) -> tuple[Optional[str], list[JobListing]]:
+        """
+        Run all strategies concurrently and return the highest-priority one
+        with jobs, as soon as every strategy ahead of it has finished.
+        """
+        tasks = [
+            (name, asyncio.create_task(self._run(name, strategy)))
+            for name, strategy in strategies
+        ]
+        try:
+            for name, task in tasks:
+                jobs = await task
+                if jobs:
+                    return name, jobs
+            return None, []
+        finally:
+            for _, task in tasks:
+                task.cancel()
+            await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
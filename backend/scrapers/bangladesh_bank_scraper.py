@@ -7,9 +7,11 @@ which means automated scraping cannot reliably access job listings.
 This scraper handles that gracefully by returning empty when CAPTCHA is detected.
 """
 from .base_scraper import BaseScraper, JobListing
+from .dates import extract_dates
+from .dedupe import unique_jobs
+from .keywords import keyword_set
 from datetime import datetime
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -22,17 +24,17 @@ class BangladeshBankScraper(BaseScraper):
     CAREER_URL = "https://erecruitment.bb.org.bd/"
     NOTICE_URL = "https://erecruitment.bb.org.bd/onlineapp/joblist.php"
 
-    SKIP_PATTERNS = [
+    SKIP_MATCHER = keyword_set([
         "erecruitment home", "edit resume", "guidance",
         "online job application", "contact us", "login",
         "register", "forgot password", "help", "faq",
         "privacy policy", "terms", "sitemap",
-    ]
+    ])
 
-    CAPTCHA_PATTERNS = [
+    CAPTCHA_MATCHER = keyword_set([
         "captcha", "what code is in the image",
         "please enable javascript", "security verification",
-    ]
+    ])
 
     async def scrape(self) -> list[JobListing]:
         """Scrape job listings from Bangladesh Bank's e-recruitment portal."""
@@ -41,8 +43,8 @@ class BangladeshBankScraper(BaseScraper):
         # Try main career page
         soup = await self.fetch_page(self.CAREER_URL)
         if soup:
-            page_text = soup.get_text(strip=True).lower()
-            if any(pattern in page_text for pattern in self.CAPTCHA_PATTERNS):
+            page_text = soup.get_text(strip=True)
+            if self.CAPTCHA_MATCHER.search(page_text):
                 logger.warning(f"{self.COMPANY_NAME}: CAPTCHA detected, cannot scrape")
                 return jobs
             jobs.extend(self._parse_job_tables(soup))
@@ -51,22 +53,17 @@ class BangladeshBankScraper(BaseScraper):
         if not jobs:
             notice_soup = await self.fetch_page(self.NOTICE_URL)
             if notice_soup:
-                page_text = notice_soup.get_text(strip=True).lower()
-                if any(pattern in page_text for pattern in self.CAPTCHA_PATTERNS):
+                page_text = notice_soup.get_text(strip=True)
+                if self.CAPTCHA_MATCHER.search(page_text):
                     logger.warning(f"{self.COMPANY_NAME}: CAPTCHA on job list page")
                     return jobs
                 jobs.extend(self._parse_job_tables(notice_soup))
 
-        # Remove duplicates
-        seen = set()
-        unique_jobs = []
-        for job in jobs:
-            if job.title not in seen:
-                seen.add(job.title)
-                unique_jobs.append(job)
+        # Remove duplicates (the same notice is linked from several tables)
+        jobs = unique_jobs(jobs, key=lambda job: job.title)
 
-        logger.info(f"Found {len(unique_jobs)} jobs at {self.COMPANY_NAME}")
-        return unique_jobs
+        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
+        return jobs
 
     def _parse_job_tables(self, soup) -> list[JobListing]:
         """Parse job listings from table-based layout."""
@@ -126,20 +123,9 @@ class BangladeshBankScraper(BaseScraper):
 
     def _extract_deadline(self, cells) -> datetime | None:
         """Extract deadline date from table cells."""
-        for cell in cells:
-            text = cell.get_text(strip=True)
-            date_match = re.search(r'(\d{1,2})[-/](\d{1,2})[-/](\d{2,4})', text)
-            if date_match:
-                try:
-                    date_str = date_match.group()
-                    sep = "-" if "-" in date_str else "/"
-                    fmt = f"%d{sep}%m{sep}%Y" if len(date_match.group(3)) == 4 else f"%d{sep}%m{sep}%y"
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    pass
-        return None
+        dates = extract_dates(cell.get_text(strip=True) for cell in cells)
+        return dates[0] if dates else None
 
     def _is_skip_title(self, title: str) -> bool:
         """Check if title is a navigation link, not a job posting."""
-        normalized = title.lower().strip()
-        return any(pattern in normalized for pattern in self.SKIP_PATTERNS)
+        return self.SKIP_MATCHER.search(title)
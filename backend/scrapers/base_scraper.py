@@ -1,17 +1,43 @@
 """
 Base scraper class that all company scrapers inherit from.
 """
-from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from abc import ABC
+from collections import Counter
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+import asyncio
+import time
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import logging
 
+from .http_client import get_shared_client, redirect_cache
+from .metrics import ScraperMetrics
+from .parse_pool import parse_in_process
+from .soup import make_soup
+from .keywords import KeywordMatcher
+from .page_cache import page_cache, CacheEntry, content_hash
+from .rate_limiter import rate_limiter, BACKOFF_STATUSES
+from .seen_index import seen_index, listing_fingerprint
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Keywords that mark a job as .NET/C# related
+DOTNET_MATCHER = KeywordMatcher({".NET": [
+    ".net", "dotnet", "c#", "csharp", "asp.net", "entity framework",
+    "azure", "sql server", "mssql", "backend", "full-stack", "fullstack"
+]})
+
+# Experience levels, checked in this order of precedence
+EXPERIENCE_MATCHER = KeywordMatcher({
+    "Senior": ["senior", "sr.", "lead", "principal", "staff"],
+    "Junior": ["junior", "jr.", "entry", "fresher", "fresh"],
+    "Mid-Level": ["mid", "intermediate", "associate"],
+    "Intern": ["intern", "trainee"],
+})
+
 
 @dataclass
 class JobListing:
@@ -28,41 +54,123 @@ class JobListing:
     deadline: Optional[datetime] = None
     salary_range: Optional[str] = None
     tags: list[str] = field(default_factory=list)
+    source: Optional[str] = None  # Scraper that produced the listing
+    # Detail page not fetched this run (see enrich_details); the stored
+    # description/requirements/deadline are kept instead of being cleared
+    details_skipped: bool = False
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dict."""
+        data = asdict(self)
+        for key in ("posted_date", "deadline"):
+            if data[key] is not None:
+                data[key] = data[key].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobListing":
+        """Rebuild a listing produced by to_dict()."""
+        data = dict(data)
+        for key in ("posted_date", "deadline"):
+            if data.get(key):
+                data[key] = datetime.fromisoformat(data[key])
+        return cls(**data)
 
 
 class BaseScraper(ABC):
     """
     Abstract base class for all job scrapers.
-    Each company scraper must implement the scrape() method.
+    Each company scraper must implement the scrape() or iter_jobs() method.
     """
 
     COMPANY_NAME: str = "Unknown"
     BASE_URL: str = ""
     CAREER_URL: str = ""
+    # Per-scraper run timeout in seconds (None uses the runner default)
+    RUN_TIMEOUT: Optional[float] = None
+    # Extra attempts after a 429/503 (the host's bucket backs off in between)
+    MAX_RETRIES: int = 1
+    # Extra headers sent with every request of this scraper
+    HEADERS: dict[str, str] = {}
+    # Per-request timeout in seconds (None uses the shared client default)
+    REQUEST_TIMEOUT: Optional[float] = None
+    # Detail pages fetched at once by enrich_details() (the host rate limit still applies)
+    DETAIL_CONCURRENCY: int = 4
+    # Parse listing pages in the process pool (see parse_pool; needs SCRAPER_PARSE_WORKERS)
+    PARSE_IN_PROCESS: bool = False
+    # Scope for listing pages parsed by scrape_page(): a SoupStrainer and/or
+    # an XPath expression selecting the subtrees the parser reads (see soup.py)
+    PARSE_ONLY: Optional[SoupStrainer] = None
+    PARSE_ROOTS: Optional[str] = None
+    # Source that reposts other companies' jobs; its listings are deduplicated
+    # after the direct sources, so a company's own posting wins (see dedupe.py)
+    IS_AGGREGATOR: bool = False
 
     def __init__(self):
-        self.client = httpx.AsyncClient(
-            timeout=30.0,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            },
-            follow_redirects=True,
-        )
+        # Pooled client shared by all scrapers; closed by close_shared_client()
+        self.client = get_shared_client()
+        # Listing cache outcomes: not_modified, unchanged (same hash), parsed
+        self.cache_stats: Counter[str] = Counter()
+        # Request counts, bytes, status codes and fetch/parse timings
+        self.metrics = ScraperMetrics()
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose()
+        pass
+
+    async def request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """
+        Send a request through the shared per-host rate limiter.
+        All scraper traffic should go through here (or fetch_page/fetch_json/post).
+        """
+        if self.HEADERS:
+            kwargs["headers"] = {**self.HEADERS, **(kwargs.get("headers") or {})}
+        if self.REQUEST_TIMEOUT is not None:
+            kwargs.setdefault("timeout", self.REQUEST_TIMEOUT)
+        if method == "GET":
+            url = redirect_cache.resolve(url)
+
+        attempt = 0
+        while True:
+            await rate_limiter.acquire(url)
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.HTTPError as e:
+                self.metrics.record_exception(e, time.perf_counter() - started)
+                raise
+            self.metrics.record_response(
+                response.status_code, len(response.content), time.perf_counter() - started
+            )
+            rate_limiter.observe(url, response.status_code, response.headers.get("Retry-After"))
+            if method == "GET":
+                redirect_cache.remember(response)
+            if response.status_code not in BACKOFF_STATUSES or attempt >= self.MAX_RETRIES:
+                return response
+            attempt += 1
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        """POST to an endpoint through the rate limiter."""
+        return await self.request("POST", url, **kwargs)
 
-    async def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse a web page."""
+    async def fetch_page(
+        self,
+        url: str,
+        parse_only: Optional[SoupStrainer] = None,
+        roots: Optional[str] = None,
+    ) -> Optional[BeautifulSoup]:
+        """
+        Fetch and parse a web page from its raw bytes.
+        `parse_only` / `roots` limit the tree to the part of the page the
+        caller reads (see soup.make_soup).
+        """
         try:
-            response = await self.client.get(url)
+            response = await self.request("GET", url)
             response.raise_for_status()
-            return BeautifulSoup(response.text, "lxml")
+            with self.metrics.parsing():
+                return make_soup(response.content, response.charset_encoding, parse_only, roots)
         except httpx.HTTPError as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
@@ -70,45 +178,186 @@ class BaseScraper(ABC):
     async def fetch_json(self, url: str) -> Optional[dict]:
         """Fetch JSON data from an API endpoint."""
         try:
-            response = await self.client.get(url)
+            response = await self.request("GET", url)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
             logger.error(f"Error fetching JSON from {url}: {e}")
             return None
 
-    @abstractmethod
+    async def scrape_page(
+        self,
+        url: str,
+        parse: Callable[..., list[JobListing]],
+        *parse_args,
+    ) -> Optional[list[JobListing]]:
+        """
+        Fetch a listing page and parse it into jobs with `parse(soup, *parse_args)`.
+        If the page is unchanged since the last run (304 Not Modified, or the
+        same body hash) the cached listings are returned without parsing.
+        Returns None if the page could not be fetched.
+        """
+        response, cached = await self._fetch_listing(url)
+        if cached is not None:
+            return cached
+        if response is None:
+            return None
+
+        with self.metrics.parsing():
+            jobs = await self._parse_listing_page(response, parse, parse_args)
+        self._store_listings(url, response, jobs)
+        return jobs
+
+    async def _parse_listing_page(
+        self,
+        response: httpx.Response,
+        parse: Callable[..., list[JobListing]],
+        parse_args: tuple,
+    ) -> list[JobListing]:
+        """Parse a page in the process pool if enabled for this scraper, else inline."""
+        if self.PARSE_IN_PROCESS and getattr(parse, "__self__", None) is self:
+            job_dicts = await parse_in_process(
+                type(self), parse.__name__, response.content,
+                response.charset_encoding, parse_args,
+            )
+            if job_dicts is not None:
+                return [JobListing.from_dict(job) for job in job_dicts]
+        soup = make_soup(response.content, response.charset_encoding, self.PARSE_ONLY, self.PARSE_ROOTS)
+        return parse(soup, *parse_args)
+
+    async def scrape_json(
+        self,
+        url: str,
+        parse: Callable[[Any], list[JobListing]],
+    ) -> Optional[list[JobListing]]:
+        """Fetch a JSON endpoint and parse it into jobs, reusing unchanged results."""
+        response, cached = await self._fetch_listing(url)
+        if cached is not None:
+            return cached
+        if response is None:
+            return None
+
+        with self.metrics.parsing():
+            try:
+                data = response.json()
+            except ValueError as e:
+                logger.error(f"Invalid JSON from {url}: {e}")
+                return None
+            jobs = parse(data)
+        self._store_listings(url, response, jobs)
+        return jobs
+
+    async def _fetch_listing(
+        self, url: str
+    ) -> tuple[Optional[httpx.Response], Optional[list[JobListing]]]:
+        """
+        GET a listing URL with cached validators.
+        Returns (None, cached_jobs) when the content is unchanged,
+        (response, None) when it needs parsing and (None, None) on error.
+        """
+        entry = page_cache.get(url)
+        headers = entry.conditional_headers() if entry else {}
+        try:
+            response = await self.request("GET", url, headers=headers)
+            if response.status_code == 304 and entry:
+                self.cache_stats["not_modified"] += 1
+                return None, [JobListing.from_dict(job) for job in entry.jobs]
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return None, None
+
+        if entry and entry.content_hash == content_hash(response.content):
+            self.cache_stats["unchanged"] += 1
+            entry.etag = response.headers.get("ETag")
+            entry.last_modified = response.headers.get("Last-Modified")
+            page_cache.put(url, entry)
+            return None, [JobListing.from_dict(job) for job in entry.jobs]
+
+        self.cache_stats["parsed"] += 1
+        return response, None
+
+    def _store_listings(self, url: str, response: httpx.Response, jobs: list[JobListing]) -> None:
+        """Remember a response's validators, body hash and the jobs parsed from it."""
+        page_cache.put(url, CacheEntry(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            content_hash=content_hash(response.content),
+            jobs=[job.to_dict() for job in jobs],
+        ))
+
+    async def enrich_details(
+        self,
+        jobs: list[JobListing],
+        fetch_detail: Callable[[JobListing], Awaitable[bool]],
+    ) -> list[tuple[JobListing, str]]:
+        """
+        Fill in listings from their detail pages, DETAIL_CONCURRENCY at a time.
+        `fetch_detail(job)` updates the job in place and returns True on success.
+        Jobs whose details are already stored and still fresh (see seen_index)
+        are skipped. Skipped and failed jobs are marked `details_skipped`, so
+        saving them keeps the stored details. Returns (job, reason) for every
+        job that failed.
+        """
+        pending = []
+        for job in jobs:
+            job.details_skipped = not seen_index.needs_fetch(job)
+            if not job.details_skipped:
+                pending.append(job)
+        self.metrics.details["skipped"] += len(jobs) - len(pending)
+        semaphore = asyncio.Semaphore(max(self.DETAIL_CONCURRENCY, 1))
+        failures: list[tuple[JobListing, str]] = []
+
+        async def enrich(job: JobListing) -> None:
+            # Fingerprint the listing before the detail page modifies it
+            fingerprint = listing_fingerprint(job)
+            async with semaphore:
+                try:
+                    fetched = await fetch_detail(job)
+                    reason = None if fetched else "detail page not fetched"
+                except Exception as e:
+                    reason = f"{type(e).__name__}: {e}"
+            if reason is None:
+                seen_index.mark_fetched(job, fingerprint)
+                self.metrics.details["fetched"] += 1
+            else:
+                job.details_skipped = True
+                failures.append((job, reason))
+                self.metrics.details["failed"] += 1
+                logger.warning(f"{self.COMPANY_NAME}: details failed for {job.url}: {reason}")
+
+        await asyncio.gather(*(enrich(job) for job in pending))
+        return failures
+
     async def scrape(self) -> list[JobListing]:
         """
         Scrape job listings from the company's career page.
-        Must be implemented by each company scraper.
+        Each company scraper must implement either scrape() or iter_jobs();
+        for streaming scrapers this collects iter_jobs() into a list.
 
         Returns:
             List of JobListing objects.
         """
-        pass
+        if type(self).iter_jobs is BaseScraper.iter_jobs:
+            raise NotImplementedError(f"{type(self).__name__} must implement scrape() or iter_jobs()")
+        return [job async for job in self.iter_jobs()]
+
+    async def iter_jobs(self) -> AsyncIterator[JobListing]:
+        """
+        Yield job listings as they are parsed.
+        Scrapers that fetch several pages should override this so their
+        results can be saved while later pages are still downloading;
+        by default it yields the result of scrape().
+        """
+        for job in await self.scrape():
+            yield job
 
     def is_dotnet_related(self, job: JobListing) -> bool:
         """Check if a job is related to .NET/C# development."""
-        keywords = [
-            ".net", "dotnet", "c#", "csharp", "asp.net", "entity framework",
-            "azure", "sql server", "mssql", "backend", "full-stack", "fullstack"
-        ]
-
-        text_to_search = f"{job.title} {job.description or ''} {job.requirements or ''}".lower()
-        return any(keyword in text_to_search for keyword in keywords)
+        text_to_search = f"{job.title} {job.description or ''} {job.requirements or ''}"
+        return DOTNET_MATCHER.search(text_to_search)
 
     def extract_experience_level(self, title: str, description: str = "") -> str:
         """Extract experience level from job title or description."""
-        text = f"{title} {description}".lower()
-
-        if any(word in text for word in ["senior", "sr.", "lead", "principal", "staff"]):
-            return "Senior"
-        elif any(word in text for word in ["junior", "jr.", "entry", "fresher", "fresh"]):
-            return "Junior"
-        elif any(word in text for word in ["mid", "intermediate", "associate"]):
-            return "Mid-Level"
-        elif any(word in text for word in ["intern", "trainee"]):
-            return "Intern"
-
-        return "Not Specified"
+        levels = EXPERIENCE_MATCHER.categories(f"{title} {description}")
+        return levels[0] if levels else "Not Specified"
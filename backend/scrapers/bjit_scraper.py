@@ -3,6 +3,8 @@ Scraper for BJIT Group careers page.
 URL: https://bjitgroup.com/career
 """
 from .base_scraper import BaseScraper, JobListing
+from .dedupe import unique_jobs
+from .keywords import keyword_set
 import logging
 
 logger = logging.getLogger(__name__)
@@ -15,11 +17,14 @@ class BJITScraper(BaseScraper):
     BASE_URL = "https://bjitgroup.com"
     CAREER_URL = "https://bjitgroup.com/career"
 
-    NO_VACANCY_PATTERNS = [
+    NO_VACANCY_MATCHER = keyword_set([
         "no vacancies", "no vacancy", "no current openings",
         "no positions", "currently no", "no jobs available",
         "no open positions",
-    ]
+    ])
+
+    # Path segments of job detail pages
+    JOB_URL_MATCHER = keyword_set(["/career/", "/job/", "/position/", "/vacancy/", "/opening/"])
 
     SKIP_TITLES = {
         "career", "careers", "home", "about", "contact",
@@ -29,17 +34,23 @@ class BJITScraper(BaseScraper):
 
     async def scrape(self) -> list[JobListing]:
         """Scrape job listings from BJIT's career page."""
-        jobs = []
-        soup = await self.fetch_page(self.CAREER_URL)
+        jobs = await self.scrape_page(self.CAREER_URL, self._parse_listing)
 
-        if not soup:
+        if jobs is None:
             logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
-            return jobs
+            return []
+
+        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
+        return jobs
+
+    def _parse_listing(self, soup) -> list[JobListing]:
+        """Parse job listings from the career page."""
+        jobs = []
 
         try:
             # Check if page says "no vacancies"
-            page_text = soup.get_text(strip=True).lower()
-            if any(pattern in page_text for pattern in self.NO_VACANCY_PATTERNS):
+            page_text = soup.get_text(strip=True)
+            if self.NO_VACANCY_MATCHER.search(page_text):
                 logger.info(f"{self.COMPANY_NAME}: No vacancies available")
                 return jobs
 
@@ -59,18 +70,11 @@ class BJITScraper(BaseScraper):
                 jobs = self._find_job_links(soup)
 
             # Remove duplicates by URL
-            seen_urls = set()
-            unique_jobs = []
-            for job in jobs:
-                if job.url not in seen_urls:
-                    seen_urls.add(job.url)
-                    unique_jobs.append(job)
-            jobs = unique_jobs
+            jobs = unique_jobs(jobs)
 
         except Exception as e:
             logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
 
-        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
         return jobs
 
     def _parse_job_card(self, card) -> JobListing | None:
@@ -117,7 +121,6 @@ class BJITScraper(BaseScraper):
     def _find_job_links(self, soup) -> list[JobListing]:
         """Find actual job posting links, not navigation."""
         jobs = []
-        seen_urls = set()
 
         for link in soup.select("a[href]"):
             href = link.get("href", "").strip()
@@ -140,15 +143,8 @@ class BJITScraper(BaseScraper):
                 continue
 
             # Must look like a job detail page
-            href_lower = href.lower()
-            if not any(kw in href_lower for kw in [
-                "/career/", "/job/", "/position/", "/vacancy/", "/opening/",
-            ]):
-                continue
-
-            if href in seen_urls:
+            if not self.JOB_URL_MATCHER.search(href):
                 continue
-            seen_urls.add(href)
 
             jobs.append(JobListing(
                 company=self.COMPANY_NAME,
@@ -3,6 +3,7 @@ Scraper for Cefalo Bangladesh careers page.
 URL: https://career.cefalo.com/
 """
 from .base_scraper import BaseScraper, JobListing
+from .dates import parse_date
 from datetime import datetime
 import logging
 import re
@@ -19,12 +20,23 @@ class CefaloScraper(BaseScraper):
 
     async def scrape(self) -> list[JobListing]:
         """Scrape job listings from Cefalo's career page."""
-        jobs = []
-        soup = await self.fetch_page(self.CAREER_URL)
+        jobs = await self.scrape_page(self.CAREER_URL, self._parse_listing)
 
-        if not soup:
+        if jobs is None:
             logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
-            return jobs
+            return []
+
+        # Fetch details (including deadline) concurrently, skipping jobs whose
+        # details are already stored
+        failures = await self.enrich_details(jobs, self._fetch_job_details)
+
+        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME} "
+                    f"({len(failures)} detail pages failed)")
+        return jobs
+
+    def _parse_listing(self, soup) -> list[JobListing]:
+        """Parse job cards from the career page."""
+        jobs = []
 
         try:
             # Find job listing cards
@@ -56,7 +68,7 @@ class CefaloScraper(BaseScraper):
                     location = location_elem.get_text(strip=True) if location_elem else "Dhaka, Bangladesh"
 
                     # Try to extract deadline from card text
-                    deadline = self._extract_deadline_from_text(card.get_text())
+                    deadline = parse_date(card.get_text())
 
                     job = JobListing(
                         company=self.COMPANY_NAME,
@@ -73,21 +85,16 @@ class CefaloScraper(BaseScraper):
                     logger.error(f"Error parsing job card: {e}")
                     continue
 
-            # Fetch details for each job (including deadline)
-            for job in jobs[:5]:
-                await self._fetch_job_details(job)
-
         except Exception as e:
-            logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
+            logger.error(f"Error parsing {self.COMPANY_NAME} career page: {e}")
 
-        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
         return jobs
 
-    async def _fetch_job_details(self, job: JobListing) -> None:
-        """Fetch additional details for a job listing."""
+    async def _fetch_job_details(self, job: JobListing) -> bool:
+        """Fetch additional details for a job listing. Returns True on success."""
         soup = await self.fetch_page(job.url)
         if not soup:
-            return
+            return False
 
         try:
             # Extract description
@@ -108,6 +115,9 @@ class CefaloScraper(BaseScraper):
 
         except Exception as e:
             logger.error(f"Error fetching job details: {e}")
+            return False
+
+        return True
 
     def _extract_deadline_from_detail(self, soup) -> datetime | None:
         """Extract deadline from Cefalo's job detail page.
@@ -118,7 +128,7 @@ class CefaloScraper(BaseScraper):
             apply_sec = soup.select_one(".apply-sec")
             if apply_sec:
                 text = apply_sec.get_text(strip=True)
-                return self._extract_deadline_from_text(text)
+                return parse_date(text)
 
             # Try finding any element containing "deadline" text
             for elem in soup.find_all(string=re.compile(r'deadline|last date|apply before', re.I)):
@@ -128,7 +138,7 @@ class CefaloScraper(BaseScraper):
                     context_text = parent.get_text(strip=True)
                     if parent.parent:
                         context_text = parent.parent.get_text(strip=True)
-                    deadline = self._extract_deadline_from_text(context_text)
+                    deadline = parse_date(context_text)
                     if deadline:
                         return deadline
 
@@ -136,35 +146,3 @@ class CefaloScraper(BaseScraper):
             logger.error(f"Error extracting deadline: {e}")
 
         return None
-
-    def _extract_deadline_from_text(self, text: str) -> datetime | None:
-        """Extract a date from text in various formats."""
-        if not text:
-            return None
-
-        # Format: "14 December 2025" or "14 Dec 2025" or "11 Dec, 2025"
-        patterns = [
-            (r'(\d{1,2})\s+(January|February|March|April|May|June|July|August|September|October|November|December)[,]?\s+(\d{4})',
-             "%d %B %Y"),
-            (r'(\d{1,2})\s+(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*[,]?\s+(\d{4})',
-             "%d %b %Y"),
-            (r'(\d{1,2})[-/](\d{1,2})[-/](\d{4})',
-             None),  # Will handle separately
-        ]
-
-        for pattern, fmt in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    if fmt:
-                        date_str = f"{match.group(1)} {match.group(2)} {match.group(3)}"
-                        return datetime.strptime(date_str, fmt)
-                    else:
-                        # DD-MM-YYYY or DD/MM/YYYY
-                        date_str = match.group()
-                        sep = "-" if "-" in date_str else "/"
-                        return datetime.strptime(date_str, f"%d{sep}%m{sep}%Y")
-                except ValueError:
-                    continue
-
-        return None
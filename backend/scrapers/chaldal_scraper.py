@@ -6,6 +6,7 @@ Chaldal uses .NET, F#, C#, SQL Server, TypeScript in their tech stack.
 Page structure: div.list-group > a[href="#"] > span (title) + p (locations)
 """
 from .base_scraper import BaseScraper, JobListing
+from .keywords import KeywordMatcher, keyword_set
 import logging
 import re
 
@@ -18,15 +19,42 @@ class ChaldalScraper(BaseScraper):
     COMPANY_NAME = "Chaldal"
     BASE_URL = "https://chaldal.tech"
     CAREER_URL = "https://chaldal.tech/"
+    # Words every job title contains at least one of
+    ROLE_MATCHER = keyword_set([
+        "engineer", "developer", "designer", "analyst",
+        "manager", "lead", "architect", "intern",
+    ])
+
+    TECH_MATCHER = KeywordMatcher({
+        ".NET": [".net", "dotnet", ".net core"],
+        "F#": ["f#", "fsharp"],
+        "C#": ["c#", "csharp"],
+        "SQL Server": ["sql server", "mssql"],
+        "TypeScript": ["typescript"],
+        "React": ["react", "reactjs"],
+        "React Native": ["react native"],
+        "Python": ["python"],
+        "JavaScript": ["javascript"],
+    })
+
+    # Only the containers of the job cards are parsed into soup; the apply
+    # link and description are siblings of div.list-group inside them
+    PARSE_ROOTS = "//div[contains(concat(' ', normalize-space(@class), ' '), ' list-group ')]/.."
 
     async def scrape(self) -> list[JobListing]:
         """Scrape job listings from Chaldal Engineering's careers page."""
-        jobs = []
-        soup = await self.fetch_page(self.CAREER_URL)
+        jobs = await self.scrape_page(self.CAREER_URL, self._parse_listing)
 
-        if not soup:
+        if jobs is None:
             logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
-            return jobs
+            return []
+
+        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
+        return jobs
+
+    def _parse_listing(self, soup) -> list[JobListing]:
+        """Parse job listings from the career page."""
+        jobs = []
 
         try:
             # Chaldal uses: div.list-group > a[href="#"] > span (title) + p (locations)
@@ -44,11 +72,7 @@ class ChaldalScraper(BaseScraper):
                     continue
 
                 # Must look like a job title
-                title_lower = title.lower()
-                if not any(kw in title_lower for kw in [
-                    "engineer", "developer", "designer", "analyst",
-                    "manager", "lead", "architect", "intern",
-                ]):
+                if not self.ROLE_MATCHER.search(title):
                     continue
 
                 # Extract location from <p> child
@@ -86,7 +110,6 @@ class ChaldalScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
 
-        logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME}")
         return jobs
 
     def _find_apply_link(self, card) -> str | None:
@@ -132,22 +155,4 @@ class ChaldalScraper(BaseScraper):
 
     def _extract_tech_tags(self, text: str) -> list[str]:
         """Extract technology tags from text."""
-        tags = ["Chaldal"]
-        tech_map = {
-            ".NET": [".net", "dotnet", ".net core"],
-            "F#": ["f#", "fsharp"],
-            "C#": ["c#", "csharp"],
-            "SQL Server": ["sql server", "mssql"],
-            "TypeScript": ["typescript"],
-            "React": ["react", "reactjs"],
-            "React Native": ["react native"],
-            "Python": ["python"],
-            "JavaScript": ["javascript"],
-        }
-
-        text_lower = text.lower()
-        for tag, keywords in tech_map.items():
-            if any(kw in text_lower for kw in keywords):
-                tags.append(tag)
-
-        return tags
+        return ["Chaldal", *self.TECH_MATCHER.categories(text)]
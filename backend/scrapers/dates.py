@@ -0,0 +1,97 @@
+"""
+Deadline date extraction shared by all scrapers.
+
+Formats seen on the career pages and government notice tables:
+
+    14 December 2025, 14 Dec 2025, 11 Dec, 2025, 1st Jan 2026
+    10-02-2026, 10/02/2026, 10-02-26 (day first)
+    2026-02-10, 2026/02/10 (ISO order)
+
+Bangla digits (০-৯) are translated to ASCII first, so "১০-০২-২০২৬" parses
+too. Month-name dates take precedence over numeric ones in the same text.
+A numeric date must not be part of a longer run of digits, so "2025-10-02"
+is never read as 25-10-02. Month-name dates may follow other digits, since
+get_text(strip=True) glues cells together ("Vacancy214 Dec 2025").
+Patterns are compiled once, matches are turned into datetimes without
+strptime, and results are cached per string since the same cell texts
+repeat across rows and runs.
+"""
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Optional
+
+_BANGLA_DIGITS = str.maketrans("০১২৩৪৫৬৭৮৯", "0123456789")
+
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+# "14 December 2025", "14 Dec, 2025", "1st Jan 2026"
+_MONTH_NAME_DATE = re.compile(
+    r"(\d{1,2})(?:st|nd|rd|th)?\s+"
+    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?,?\s+(\d{4})(?!\d)",
+    re.IGNORECASE,
+)
+
+# "2026-02-10", "2026/02/10" (iso_*), or "10-02-2026", "10/02/2026",
+# "10-02-26"; the same separator on both sides
+_NUMERIC_DATE = re.compile(
+    r"(?<!\d)(?:"
+    r"(?P<iso_year>\d{4})(?P<iso_sep>[-/])(?P<iso_month>\d{1,2})(?P=iso_sep)(?P<iso_day>\d{1,2})"
+    r"|(?P<day>\d{1,2})(?P<sep>[-/])(?P<month>\d{1,2})(?P=sep)(?P<year>\d{4}|\d{2})"
+    r")(?!\d)"
+)
+
+
+def _make_date(year: int, month: int, day: int) -> Optional[datetime]:
+    try:
+        return datetime(year, month, day)
+    except ValueError:
+        return None
+
+
+def _expand_year(year: str) -> int:
+    """Two-digit years follow strptime's %y pivot (69-99 -> 19xx)."""
+    value = int(year)
+    if len(year) == 2:
+        value += 1900 if value >= 69 else 2000
+    return value
+
+
+@lru_cache(maxsize=4096)
+def parse_date(text: str) -> Optional[datetime]:
+    """First valid date in the text, or None."""
+    if not text:
+        return None
+    text = text.translate(_BANGLA_DIGITS)
+
+    for match in _MONTH_NAME_DATE.finditer(text):
+        day, month, year = match.groups()
+        date = _make_date(int(year), _MONTHS[month[:3].lower()], int(day))
+        if date:
+            return date
+
+    for match in _NUMERIC_DATE.finditer(text):
+        if match["iso_year"]:
+            date = _make_date(int(match["iso_year"]), int(match["iso_month"]), int(match["iso_day"]))
+        else:
+            date = _make_date(_expand_year(match["year"]), int(match["month"]), int(match["day"]))
+        if date:
+            return date
+
+    return None
+
+
+def extract_dates(texts: Iterable[str]) -> list[datetime]:
+    """Dates found in a batch of text fragments (e.g. table cells), in order.
+
+    Fragments without a date are skipped.
+    """
+    dates = []
+    for text in texts:
+        date = parse_date(text)
+        if date:
+            dates.append(date)
+    return dates
@@ -0,0 +1,142 @@
+"""
+URL canonicalization and the run-wide duplicate index.
+
+Every scraped URL is reduced to a canonical form before it is stored or
+compared: lowercased scheme and host, default port dropped, tracking query
+parameters removed and the trailing slash of the path stripped. The rest of
+the query is kept byte for byte (the canonical URL is also the stored link),
+and fragments are kept, since some boards address postings by fragment.
+
+The DedupeIndex is applied by the job writer to every listing of a run. A
+listing is dropped if its canonical URL was already admitted, or if another
+source already admitted a listing with the same (company, title) signature,
+which is how the same job posted on the company site and on LinkedIn is
+caught. Listings from aggregator sources are admitted last, so the company's
+own posting wins.
+"""
+import re
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, Optional
+from urllib.parse import unquote_plus, urlsplit, urlunsplit
+
+if TYPE_CHECKING:
+    from .base_scraper import JobListing
+
+# Query parameters that only identify the visit, never the posting
+TRACKING_PARAMS = {
+    "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_ga", "_gl",
+}
+TRACKING_PREFIXES = ("utm_",)
+
+# Host-specific parameters (matched on the host or a parent domain). Generic
+# names such as "ref" only count as tracking on hosts known to use them so.
+HOST_TRACKING_PARAMS = {
+    "linkedin.com": {
+        "position", "pagenum", "ref", "refid", "trackingid", "trk", "trkinfo",
+        "originalsubdomain",
+    },
+}
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Legal-form and country words dropped from the end of company names in
+# signatures ("Pathao Bangladesh Ltd" -> "pathao", "Co-Op" is kept)
+COMPANY_SUFFIXES = {
+    "ltd", "limited", "inc", "plc", "pvt", "private", "llc", "co",
+    "bangladesh", "bd",
+}
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _is_tracking_param(name: str, host: str) -> bool:
+    name = name.lower()
+    if name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES):
+        return True
+    for domain, params in HOST_TRACKING_PARAMS.items():
+        if (host == domain or host.endswith(f".{domain}")) and name in params:
+            return True
+    return False
+
+
+def canonicalize_url(url: str) -> str:
+    """Canonical form of a job URL (unparseable URLs are returned stripped)."""
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    if not parts.scheme or not parts.netloc:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    netloc = host
+    if port and port != DEFAULT_PORTS.get(scheme):
+        netloc = f"{host}:{port}"
+    if parts.username or parts.password:
+        netloc = f"{parts.netloc.rsplit('@', 1)[0]}@{netloc}"
+
+    path = parts.path.rstrip("/") or "/"
+    # Filter the raw segments by name; re-encoding would rewrite the rest
+    # ("a%20b" -> "a+b", "flag" -> "flag=")
+    query = "&".join(
+        segment for segment in parts.query.split("&")
+        if segment and not _is_tracking_param(unquote_plus(segment.split("=", 1)[0]), host)
+    )
+    return urlunsplit((scheme, netloc, path, query, parts.fragment))
+
+
+def _normalize_words(text: str) -> list[str]:
+    return _NON_WORD.sub(" ", text.casefold()).split()
+
+
+def job_signature(company: str, title: str) -> tuple[str, str]:
+    """Normalized (company, title) pair identifying a posting across sources."""
+    company_words = _normalize_words(company)
+    while len(company_words) > 1 and company_words[-1] in COMPANY_SUFFIXES:
+        company_words.pop()
+    return " ".join(company_words), " ".join(_normalize_words(title))
+
+
+def unique_jobs(
+    jobs: Iterable["JobListing"],
+    key: Optional[Callable[["JobListing"], Hashable]] = None,
+) -> list["JobListing"]:
+    """First job per key (default: canonical URL), in order."""
+    key = key or (lambda job: canonicalize_url(job.url))
+    seen = set()
+    unique = []
+    for job in jobs:
+        value = key(job)
+        if value not in seen:
+            seen.add(value)
+            unique.append(job)
+    return unique
+
+
+class DedupeIndex:
+    """Canonical URLs and signatures admitted so far in a run."""
+
+    def __init__(self):
+        self.urls: set[str] = set()
+        # Signature -> source that first admitted it
+        self.signatures: dict[tuple[str, str], Optional[str]] = {}
+
+    def admit(self, job: "JobListing") -> bool:
+        """
+        Canonicalize the job's URL and record it. Returns False if the job
+        duplicates one already admitted (same URL, or same signature from
+        another source). Listings sharing a title within one source are
+        distinct postings and are kept.
+        """
+        job.url = canonicalize_url(job.url)
+        signature = job_signature(job.company, job.title)
+        first_source = self.signatures.get(signature, job.source)
+
+        if job.url in self.urls or first_source != job.source:
+            return False
+
+        self.urls.add(job.url)
+        self.signatures.setdefault(signature, job.source)
+        return True
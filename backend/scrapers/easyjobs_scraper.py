@@ -0,0 +1,201 @@
+"""
+Adapter for career portals hosted on easy.jobs (<company>.easy.jobs).
+
+easy.jobs renders job cards in the page HTML, so the single strategy is
+parsing the portal page (cached by validators/body hash like every listing).
+"""
+from .ats_scraper import ATSScraper, Strategy
+from .base_scraper import JobListing
+from .dates import parse_date
+from .dedupe import unique_jobs
+from .keywords import keyword_set
+from datetime import datetime
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class EasyJobsScraper(ATSScraper):
+    """Base scraper for easy.jobs career portals."""
+
+    # Portal root, e.g. https://brainstation-23.easy.jobs
+    BASE_URL: str = ""
+    DEFAULT_LOCATION: str = "Dhaka, Bangladesh"
+    TAGS: list[str] = []
+
+    def strategies(self) -> list[tuple[str, Strategy]]:
+        return [("html", self._scrape_html)]
+
+    async def _scrape_html(self) -> list[JobListing]:
+        """Parse the portal page."""
+        jobs = await self.scrape_page(self.CAREER_URL, self._parse_listing)
+        if jobs is None:
+            logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
+            return []
+        return jobs
+
+    def _parse_listing(self, soup) -> list[JobListing]:
+        """Parse job listings from the career page."""
+        jobs = []
+
+        try:
+            # easy.jobs renders job cards in the page HTML
+            # Look for job card elements
+            job_elements = self._find_job_elements(soup)
+
+            for elem in job_elements:
+                job = self._parse_job_element(elem)
+                if job:
+                    jobs.append(job)
+
+            # If structured parsing didn't work, try link-based parsing
+            if not jobs:
+                jobs = self._parse_job_links(soup)
+
+            # Remove duplicates by URL
+            jobs = unique_jobs(jobs)
+
+        except Exception as e:
+            logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
+
+        return jobs
+
+    def _find_job_elements(self, soup) -> list:
+        """Find job card/listing elements in the page."""
+        # Try various selectors that easy.jobs might use
+        selectors = [
+            ".job-card", ".ej-job-card", ".position-card",
+            ".job-listing", "[class*='job-card']",
+            ".card.job", "article.job",
+        ]
+
+        for selector in selectors:
+            elements = soup.select(selector)
+            if elements:
+                return elements
+
+        return []
+
+    def _parse_job_element(self, elem) -> JobListing | None:
+        """Parse a job card element into a JobListing."""
+        try:
+            # Extract title
+            title_elem = elem.select_one("h2, h3, h4, .job-title, .title, a")
+            title = title_elem.get_text(strip=True) if title_elem else ""
+
+            if not title or len(title) < 5:
+                return None
+
+            # Extract URL
+            link = elem.select_one("a[href]")
+            if not link:
+                return None
+            url = link.get("href", "")
+            if not url:
+                return None
+            if not url.startswith("http"):
+                url = f"{self.BASE_URL}/{url.lstrip('/')}"
+
+            # Extract deadline
+            deadline = self._extract_deadline_from_element(elem)
+
+            # Extract location
+            location = self.DEFAULT_LOCATION
+            loc_elem = elem.select_one(".location, [class*='location']")
+            if loc_elem:
+                location = loc_elem.get_text(strip=True) or location
+
+            tags = list(self.TAGS)
+
+            return JobListing(
+                company=self.COMPANY_NAME,
+                title=title,
+                url=url,
+                location=location,
+                deadline=deadline,
+                experience_level=self.extract_experience_level(title),
+                tags=tags,
+            )
+        except Exception as e:
+            logger.error(f"Error parsing job element: {e}")
+            return None
+
+    # Non-job URL path segments to skip
+    SKIP_URL_MATCHER = keyword_set([
+        "/locale/", "/company/", "/about/", "/contact/",
+        "/login", "/register", "/signup", "/sign-up",
+        "/privacy", "/terms", "/faq", "/help",
+        "/category/", "/tag/", "/page/", "/author/",
+    ])
+
+    # Non-job title patterns
+    SKIP_TITLE_MATCHER = keyword_set([
+        "apply now", "learn more", "read more", "view all",
+        "contact", "about", "home", "career", "login", "sign up",
+        "english", "bangla", "chinese", "japanese", "korean",
+        "french", "german", "spanish", "arabic", "hindi",
+        "traditional", "simplified", "português", "italiano",
+    ])
+
+    def _parse_job_links(self, soup) -> list[JobListing]:
+        """Fallback: parse job links from the page."""
+        jobs = []
+
+        for link in soup.select("a[href]"):
+            href = link.get("href", "").strip()
+            title = link.get_text(strip=True)
+
+            if not title or not href:
+                continue
+
+            # Must be a link to a specific job on easy.jobs
+            if "easy.jobs" not in href and not href.startswith("/"):
+                continue
+
+            # Skip short titles (likely nav links)
+            if len(title) < 10:
+                continue
+
+            # Skip navigation/non-job titles
+            if self.SKIP_TITLE_MATCHER.search(title):
+                continue
+
+            # Normalize URL
+            if not href.startswith("http"):
+                href = f"{self.BASE_URL}/{href.lstrip('/')}"
+
+            # Must look like a job detail URL (not homepage, not company page)
+            if href.rstrip("/") == self.BASE_URL.rstrip("/"):
+                continue
+
+            # Skip non-job URL paths (locale, company info, etc.)
+            if self.SKIP_URL_MATCHER.search(href):
+                continue
+
+            # Try to find deadline near this link
+            deadline = self._extract_deadline_nearby(link)
+
+            jobs.append(JobListing(
+                company=self.COMPANY_NAME,
+                title=title,
+                url=href,
+                location=self.DEFAULT_LOCATION,
+                deadline=deadline,
+                experience_level=self.extract_experience_level(title),
+                tags=list(self.TAGS),
+            ))
+
+        return jobs
+
+    def _extract_deadline_from_element(self, elem) -> datetime | None:
+        """Extract deadline date from a job element."""
+        text = elem.get_text(strip=True)
+        return parse_date(text)
+
+    def _extract_deadline_nearby(self, link_elem) -> datetime | None:
+        """Try to find a deadline date near a link element."""
+        parent = link_elem.parent
+        if parent:
+            text = parent.get_text(strip=True)
+            return parse_date(text)
+        return None
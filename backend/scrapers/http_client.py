@@ -0,0 +1,148 @@
+"""
+Process-wide pooled HTTP client shared by all scrapers.
+
+One httpx.AsyncClient (per event loop) keeps connections alive between
+scrapers and between runs, so TCP/TLS setup and DNS lookups are paid once
+per host instead of once per scraper. Permanent redirects are remembered so
+that e.g. selise.ch is not re-resolved to selisegroup.com on every request.
+
+Configuration (environment):
+    SCRAPER_HTTP2             enable HTTP/2 when the h2 package is installed (default 1)
+    SCRAPER_MAX_CONNECTIONS   total connection pool size (default 20)
+    SCRAPER_MAX_KEEPALIVE     idle keep-alive connections kept open (default 10)
+    SCRAPER_KEEPALIVE_EXPIRY  seconds an idle connection is kept (default 60)
+"""
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# HTTP/2 and brotli are optional - only enable them if available
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+DEFAULT_TIMEOUT = 30.0
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+    "Accept-Encoding": "gzip, deflate, br" if BROTLI_AVAILABLE else "gzip, deflate",
+}
+
+# Redirect statuses that are safe to remember across requests
+PERMANENT_REDIRECTS = {301, 308}
+
+
+class RedirectCache:
+    """Small LRU map of URLs to the final URL of a permanent redirect chain."""
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._targets: OrderedDict[str, str] = OrderedDict()
+
+    def resolve(self, url: str) -> str:
+        target = self._targets.get(url)
+        if target is None:
+            return url
+        self._targets.move_to_end(url)
+        return target
+
+    def remember(self, response: httpx.Response) -> None:
+        """Record the redirect chain of a response if every hop was permanent."""
+        if not response.history:
+            return
+        if any(hop.status_code not in PERMANENT_REDIRECTS for hop in response.history):
+            return
+        target = str(response.url)
+        for hop in response.history:
+            self._targets[str(hop.url)] = target
+            self._targets.move_to_end(str(hop.url))
+        while len(self._targets) > self.max_size:
+            self._targets.popitem(last=False)
+
+    def clear(self) -> None:
+        self._targets.clear()
+
+
+redirect_cache = RedirectCache()
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    http2 = HTTP2_AVAILABLE and os.getenv("SCRAPER_HTTP2", "1") == "1"
+    limits = httpx.Limits(
+        max_connections=int(os.getenv("SCRAPER_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.getenv("SCRAPER_MAX_KEEPALIVE", "10")),
+        keepalive_expiry=float(os.getenv("SCRAPER_KEEPALIVE_EXPIRY", "60")),
+    )
+    logger.debug(f"Creating shared HTTP client (http2={http2})")
+    return httpx.AsyncClient(
+        timeout=DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+        http2=http2,
+        limits=limits,
+    )
+
+
+def _discard_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """
+    Close a client left behind by another event loop. Its connections can
+    only be closed on that loop: right away if it runs in another thread,
+    or when it next runs. A closed loop already took its sockets down.
+    """
+    if client.is_closed or loop is None or loop.is_closed():
+        return
+    logger.debug("Closing shared HTTP client of a previous event loop")
+    asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide scraper client, creating it on first use.
+    A new client is built if the previous one was closed or belongs to
+    another event loop (pooled connections cannot cross loops); the
+    previous client is closed on its own loop.
+    """
+    global _client, _client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None:
+            _discard_client(_client, _client_loop)
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_shared_client() -> None:
+    """Close the shared client and its pooled connections."""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
@@ -0,0 +1,103 @@
+"""
+Multi-pattern keyword matching (Aho-Corasick).
+
+Scrapers classify titles and descriptions against many keyword lists
+(.NET detection, experience level, tech tags, navigation/CAPTCHA filters).
+A KeywordMatcher compiles every keyword of every category into one
+automaton, so a single pass over the text finds all hits regardless of how
+many keywords there are. Matching is case-insensitive substring matching,
+the same as `keyword in text.lower()`.
+
+    LEVELS = KeywordMatcher({"Senior": ["senior", "lead"], "Junior": ["junior"]})
+    LEVELS.categories("Senior Team Lead")   # ["Senior"]
+    keyword_set(["captcha", "security check"]).search(page_text)
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Iterable, Iterator, Mapping
+
+
+class KeywordMatcher:
+    """Compiled Aho-Corasick automaton mapping keywords to categories."""
+
+    def __init__(self, categories: Mapping[str, Iterable[str]]):
+        self.category_names = list(categories)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        # Category indices ending at each state (including via fail links)
+        self._out: list[tuple[int, ...]] = [()]
+
+        for index, name in enumerate(self.category_names):
+            for keyword in categories[name]:
+                self._add(keyword.lower(), index)
+        self._build_fail_links()
+
+    def _add(self, keyword: str, category: int) -> None:
+        if not keyword:
+            return
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = next_state
+        if category not in self._out[state]:
+            self._out[state] += (category,)
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                inherited = tuple(c for c in self._out[self._fail[next_state]]
+                                  if c not in self._out[next_state])
+                self._out[next_state] += inherited
+
+    def _scan(self, text: str) -> Iterator[tuple[int, ...]]:
+        """Yield the category indices of every state with output."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                yield out[state]
+
+    def categories(self, text: str) -> list[str]:
+        """Every category with a keyword in the text, in definition order."""
+        if not text:
+            return []
+        found: set[int] = set()
+        total = len(self.category_names)
+        for hits in self._scan(text):
+            found.update(hits)
+            if len(found) == total:
+                break
+        return [self.category_names[i] for i in sorted(found)]
+
+    def search(self, text: str) -> bool:
+        """True if any keyword occurs in the text."""
+        if not text:
+            return False
+        return next(self._scan(text), None) is not None
+
+
+@lru_cache(maxsize=None)
+def _compile_set(keywords: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher({"match": keywords})
+
+
+def keyword_set(keywords: Iterable[str]) -> KeywordMatcher:
+    """Matcher for a single keyword list, compiled once per distinct list."""
+    return _compile_set(tuple(keywords))
@@ -2,34 +2,63 @@
 Scraper for .NET/C# jobs in Bangladesh from LinkedIn public job search.
 URL: https://www.linkedin.com/jobs/search
 
-LinkedIn's public (guest) job search returns initial results without authentication.
+LinkedIn's public (guest) job search returns results without authentication.
+The guest search endpoint serves result windows of PAGE_SIZE cards via
+`start=`; every keyword/location query runs concurrently and reads its
+windows in waves until a wave brings no new URLs or MAX_PAGES is reached.
 This scraper specifically targets .NET, C#, and ASP.NET related jobs.
+
+Configuration (environment):
+    LINKEDIN_KEYWORDS   ";"-separated search keywords (default: .NET developer;C# developer;ASP.NET;dotnet)
+    LINKEDIN_LOCATIONS  ";"-separated search locations (default: Bangladesh)
+    LINKEDIN_MAX_PAGES  result windows read per query (default 4)
 """
 from .base_scraper import BaseScraper, JobListing
+from .dedupe import canonicalize_url, unique_jobs
+from .keywords import KeywordMatcher
+from bs4 import SoupStrainer
 from datetime import datetime, timedelta
+from typing import AsyncIterator
+from urllib.parse import urlencode
+import asyncio
 import logging
+import os
 import re
 
 logger = logging.getLogger(__name__)
 
 
+def _env_list(name: str, default: list[str]) -> list[str]:
+    """Read a ";"-separated list from the environment."""
+    value = os.getenv(name, "")
+    items = [item.strip() for item in value.split(";") if item.strip()]
+    return items or default
+
+
 class LinkedInDotNetScraper(BaseScraper):
     """Scraper for .NET/C# jobs in Bangladesh from LinkedIn."""
 
     COMPANY_NAME = "LinkedIn (.NET Jobs)"
     BASE_URL = "https://www.linkedin.com"
-
-    # Multiple search queries to cover different .NET keywords
-    SEARCH_URLS = [
-        # .NET developer in Bangladesh, past month
-        "https://www.linkedin.com/jobs/search?keywords=.NET+developer&location=Bangladesh&f_TPR=r2592000",
-        # C# developer in Bangladesh, past month
-        "https://www.linkedin.com/jobs/search?keywords=C%23+developer&location=Bangladesh&f_TPR=r2592000",
-        # ASP.NET in Bangladesh, past month
-        "https://www.linkedin.com/jobs/search?keywords=ASP.NET&location=Bangladesh&f_TPR=r2592000",
-        # dotnet in Bangladesh, past month
-        "https://www.linkedin.com/jobs/search?keywords=dotnet&location=Bangladesh&f_TPR=r2592000",
-    ]
+    # Search result pages are large; parse them off the event loop
+    PARSE_IN_PROCESS = True
+    IS_AGGREGATOR = True
+    # Every job card sits in an <li>, inside ul.jobs-search__results-list on
+    # the full search page; skip the rest of the page when parsing
+    PARSE_ONLY = SoupStrainer(["ul", "li"])
+
+    # Guest search endpoint returning <li> job cards, PAGE_SIZE per window
+    GUEST_SEARCH_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    PAGE_SIZE = 25
+    # Result windows fetched at once per query, and the most read per query
+    PAGE_WAVE = 2
+    MAX_PAGES = int(os.getenv("LINKEDIN_MAX_PAGES", "4"))
+    # Posted within the past month
+    TIME_RANGE = "r2592000"
+
+    # Search queries to cover different .NET keywords (every keyword x location)
+    SEARCH_KEYWORDS = _env_list("LINKEDIN_KEYWORDS", [".NET developer", "C# developer", "ASP.NET", "dotnet"])
+    SEARCH_LOCATIONS = _env_list("LINKEDIN_LOCATIONS", ["Bangladesh"])
 
     # .NET related keywords to validate results
     DOTNET_KEYWORDS = [
@@ -47,31 +76,108 @@ class LinkedInDotNetScraper(BaseScraper):
         "go developer", "golang", "rust developer",
     ]
 
-    async def scrape(self) -> list[JobListing]:
-        """Scrape .NET/C# job listings from LinkedIn Bangladesh."""
-        jobs = []
-        seen_urls = set()
-
-        for search_url in self.SEARCH_URLS:
+    # Title classification in one pass: .NET keywords, generic developer
+    # titles, other technologies, and .NET hints for generic titles
+    TITLE_MATCHER = KeywordMatcher({
+        "dotnet": DOTNET_KEYWORDS,
+        "generic": [
+            "software engineer", "full stack", "full-stack", "fullstack",
+            "backend", "programmer",
+        ],
+        "other_tech": SKIP_TITLE_PATTERNS,
+        "hint": [".net", "c#", "sql server", "azure", "microsoft"],
+    })
+
+    TAG_MATCHER = KeywordMatcher({
+        ".NET": [".net", "dotnet"],
+        "C#": ["c#", "csharp"],
+        "ASP.NET": ["asp.net"],
+        "SQL Server": ["sql server", "mssql"],
+        "Azure": ["azure"],
+        "Entity Framework": ["entity framework", "ef core"],
+        "Full-Stack": ["full stack", "full-stack", "fullstack"],
+        "Backend": ["backend", "back-end"],
+    })
+
+    async def iter_jobs(self) -> AsyncIterator[JobListing]:
+        """Yield .NET/C# job listings from LinkedIn as the concurrent searches find them."""
+        seen_urls: set[str] = set()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        async def run(keywords: str, location: str) -> None:
             try:
-                soup = await self.fetch_page(search_url)
-                if not soup:
-                    continue
-
-                page_jobs = self._parse_job_cards(soup)
-                for job in page_jobs:
-                    if job.url not in seen_urls:
-                        seen_urls.add(job.url)
-                        jobs.append(job)
-
+                await self._search(keywords, location, seen_urls, queue)
             except Exception as e:
-                logger.error(f"Error scraping LinkedIn search: {e}")
+                logger.error(f"Error scraping LinkedIn search {keywords!r} in {location}: {e}")
+
+        tasks = [
+            asyncio.create_task(run(keywords, location))
+            for keywords in self.SEARCH_KEYWORDS
+            for location in self.SEARCH_LOCATIONS
+        ]
+        all_done = asyncio.gather(*tasks)
+        all_done.add_done_callback(lambda _: queue.put_nowait(None))
+
+        found = 0
+        try:
+            while (job := await queue.get()) is not None:
+                found += 1
+                yield job
+        finally:
+            all_done.cancel()
+
+        logger.info(f"Found {found} .NET jobs on LinkedIn ({len(seen_urls)} listings seen)")
+
+    def _search_url(self, keywords: str, location: str, start: int) -> str:
+        """Guest search URL for one result window."""
+        params = {"keywords": keywords, "location": location, "f_TPR": self.TIME_RANGE}
+        if start:
+            params["start"] = start
+        return f"{self.GUEST_SEARCH_URL}?{urlencode(params)}"
+
+    async def _search(
+        self,
+        keywords: str,
+        location: str,
+        seen_urls: set[str],
+        queue: asyncio.Queue,
+    ) -> None:
+        """
+        Read one query's result windows, PAGE_WAVE at a time, putting new .NET
+        jobs on the queue. Stops at the end of the results, after a wave that
+        only repeats URLs already seen (by this or another query), or at MAX_PAGES.
+        """
+        for first_page in range(0, self.MAX_PAGES, self.PAGE_WAVE):
+            pages = range(first_page, min(first_page + self.PAGE_WAVE, self.MAX_PAGES))
+            results = await asyncio.gather(*(
+                self.scrape_page(self._search_url(keywords, location, page * self.PAGE_SIZE),
+                                 self._parse_job_cards)
+                for page in pages
+            ))
 
-        logger.info(f"Found {len(jobs)} .NET jobs on LinkedIn Bangladesh")
-        return jobs
+            new_urls = 0
+            exhausted = False
+            for cards in results:
+                if not cards:
+                    exhausted = True
+                    continue
+                for job in cards:
+                    if job.url in seen_urls:
+                        continue
+                    seen_urls.add(job.url)
+                    new_urls += 1
+                    if self._is_dotnet_job(job.title):
+                        await queue.put(job)
+
+            if exhausted or not new_urls:
+                return
 
     def _parse_job_cards(self, soup) -> list[JobListing]:
-        """Parse job cards from LinkedIn search results page."""
+        """
+        Parse every job card from a LinkedIn search results page.
+        Non-.NET titles are filtered out by the caller, so that pagination
+        can tell a window of unrelated jobs from the end of the results.
+        """
         jobs = []
 
         # LinkedIn public search uses these selectors for job cards
@@ -109,10 +215,6 @@ class LinkedInDotNetScraper(BaseScraper):
         if not title or len(title) < 5:
             return None
 
-        # Check if title is .NET related (filter out non-.NET jobs)
-        if not self._is_dotnet_job(title):
-            return None
-
         # Extract company
         company_elem = card.select_one(
             ".base-search-card__subtitle, .job-search-card__company-name, "
@@ -134,7 +236,7 @@ class LinkedInDotNetScraper(BaseScraper):
             url = f"{self.BASE_URL}{url}"
 
         # Clean URL (remove tracking parameters)
-        url = url.split("?")[0]
+        url = canonicalize_url(url)
 
         # Extract location
         location_elem = card.select_one(
@@ -173,7 +275,6 @@ class LinkedInDotNetScraper(BaseScraper):
     def _parse_job_links(self, soup) -> list[JobListing]:
         """Fallback: parse job links from the page text."""
         jobs = []
-        seen_urls = set()
 
         for link in soup.select("a[href*='/jobs/view/']"):
             href = link.get("href", "").strip()
@@ -182,17 +283,9 @@ class LinkedInDotNetScraper(BaseScraper):
             if not title or not href or len(title) < 10:
                 continue
 
-            # Must be .NET related
-            if not self._is_dotnet_job(title):
-                continue
-
             if not href.startswith("http"):
                 href = f"{self.BASE_URL}{href}"
-            href = href.split("?")[0]
-
-            if href in seen_urls:
-                continue
-            seen_urls.add(href)
+            href = canonicalize_url(href)
 
             # Try to find company from nearby elements
             company = self._extract_company_near_link(link)
@@ -207,7 +300,7 @@ class LinkedInDotNetScraper(BaseScraper):
                 job_type="Full-time",
             ))
 
-        return jobs
+        return unique_jobs(jobs)
 
     def _extract_company_near_link(self, link_elem) -> str:
         """Try to find company name near a job link."""
@@ -230,49 +323,19 @@ class LinkedInDotNetScraper(BaseScraper):
 
     def _is_dotnet_job(self, title: str) -> bool:
         """Check if a job title is .NET/C# related."""
-        title_lower = title.lower()
+        hits = self.TITLE_MATCHER.categories(title)
 
         # Must contain at least one .NET keyword
-        has_dotnet = any(kw in title_lower for kw in self.DOTNET_KEYWORDS)
-
-        # Or generic "software engineer" / "full stack" that might be .NET
-        is_generic_dev = any(kw in title_lower for kw in [
-            "software engineer", "full stack", "full-stack", "fullstack",
-            "backend", "programmer",
-        ])
-
-        # If it's explicitly a non-.NET technology, skip
-        is_other_tech = any(kw in title_lower for kw in self.SKIP_TITLE_PATTERNS)
-
-        if has_dotnet:
+        if "dotnet" in hits:
             return True
 
-        # Generic titles are OK only if they also mention .NET-adjacent terms
-        if is_generic_dev and not is_other_tech:
-            # Check for .NET hints in the broader title
-            dotnet_hints = [".net", "c#", "sql server", "azure", "microsoft"]
-            return any(hint in title_lower for hint in dotnet_hints)
+        # Generic titles (software engineer, full stack, ...) are OK only if they
+        # are not explicitly another technology and mention .NET-adjacent terms
+        if "generic" in hits and "other_tech" not in hits:
+            return "hint" in hits
 
         return False
 
     def _build_tags(self, title: str, company: str) -> list[str]:
         """Build relevant tags for the job."""
-        tags = ["LinkedIn", "Bangladesh"]
-        text = title.lower()
-
-        tag_map = {
-            ".NET": [".net", "dotnet"],
-            "C#": ["c#", "csharp"],
-            "ASP.NET": ["asp.net"],
-            "SQL Server": ["sql server", "mssql"],
-            "Azure": ["azure"],
-            "Entity Framework": ["entity framework", "ef core"],
-            "Full-Stack": ["full stack", "full-stack", "fullstack"],
-            "Backend": ["backend", "back-end"],
-        }
-
-        for tag, keywords in tag_map.items():
-            if any(kw in text for kw in keywords):
-                tags.append(tag)
-
-        return tags
+        return ["LinkedIn", "Bangladesh", *self.TAG_MATCHER.categories(title)]
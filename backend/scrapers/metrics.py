@@ -0,0 +1,151 @@
+"""
+Per-scraper instrumentation and run report writers.
+
+Every BaseScraper owns a ScraperMetrics instance that counts requests,
+response sizes, status codes and exceptions, and accumulates time spent
+fetching and parsing. At the end of a run the runner collects them into a
+report that is written as JSON and, optionally, in the Prometheus textfile
+format (for node_exporter's textfile collector).
+"""
+import json
+import logging
+import os
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Iterator
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScraperMetrics:
+    """Counters and timings collected while one scraper runs."""
+    requests: int = 0
+    response_bytes: int = 0
+    fetch_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    status_codes: Counter = field(default_factory=Counter)
+    exceptions: Counter = field(default_factory=Counter)
+    # Detail page outcomes from enrich_details(): fetched, skipped, failed
+    details: Counter = field(default_factory=Counter)
+
+    def record_response(self, status_code: int, size: int, elapsed: float) -> None:
+        self.requests += 1
+        self.response_bytes += size
+        self.fetch_seconds += elapsed
+        self.status_codes[str(status_code)] += 1
+
+    def record_exception(self, exc: BaseException, elapsed: float) -> None:
+        self.requests += 1
+        self.fetch_seconds += elapsed
+        self.exceptions[type(exc).__name__] += 1
+
+    @contextmanager
+    def parsing(self) -> Iterator[None]:
+        """Time a block of parsing work."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.parse_seconds += time.perf_counter() - started
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "response_bytes": self.response_bytes,
+            "fetch_seconds": round(self.fetch_seconds, 3),
+            "parse_seconds": round(self.parse_seconds, 3),
+            "status_codes": dict(self.status_codes),
+            "exceptions": dict(self.exceptions),
+            "details": dict(self.details),
+        }
+
+
+def _write_atomic(path: str, content: str) -> None:
+    """Write a file via rename so readers never see a partial report."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def write_json_report(report: dict, path: str) -> None:
+    """Write the run report as JSON."""
+    try:
+        _write_atomic(path, json.dumps(report, indent=2, default=str))
+        logger.info(f"Run report written to {path}")
+    except OSError as e:
+        logger.warning(f"Could not write run report {path}: {e}")
+
+
+def _label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def format_prometheus(report: dict) -> str:
+    """Render a run report in the Prometheus text exposition format."""
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, samples: list[tuple[dict, float]]):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{k}="{_label(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+
+    sources = report.get("sources", [])
+    per_source = lambda key: [({"source": s["source"]}, s[key]) for s in sources]
+
+    metric("scraper_success", "gauge", "1 if the scraper finished without error.",
+           [({"source": s["source"]}, int(s["status"] == "ok")) for s in sources])
+    metric("scraper_duration_seconds", "gauge", "Wall time of the scraper.", per_source("duration_seconds"))
+    metric("scraper_jobs_found", "gauge", "Jobs yielded by the scraper.", per_source("job_count"))
+    # Per-run values that start from zero every run: gauges, not counters
+    metric("scraper_last_run_requests", "gauge", "HTTP requests sent in the last run.",
+           per_source("requests"))
+    metric("scraper_last_run_response_bytes", "gauge", "Response body bytes downloaded in the last run.",
+           per_source("response_bytes"))
+    metric("scraper_last_run_fetch_seconds", "gauge", "Time spent waiting on HTTP in the last run.",
+           per_source("fetch_seconds"))
+    metric("scraper_last_run_parse_seconds", "gauge", "Time spent parsing responses in the last run.",
+           per_source("parse_seconds"))
+    metric("scraper_last_run_responses", "gauge", "HTTP responses by status code in the last run.", [
+        ({"source": s["source"], "code": code}, count)
+        for s in sources for code, count in s["status_codes"].items()
+    ])
+    metric("scraper_last_run_exceptions", "gauge", "Request exceptions by type in the last run.", [
+        ({"source": s["source"], "type": exc}, count)
+        for s in sources for exc, count in s["exceptions"].items()
+    ])
+    metric("scraper_last_run_detail_pages", "gauge", "Detail page outcomes in the last run.", [
+        ({"source": s["source"], "outcome": outcome}, count)
+        for s in sources for outcome, count in s["details"].items()
+    ])
+    metric("scraper_last_run_cache", "gauge", "Listing cache outcomes in the last run.", [
+        ({"source": s["source"], "outcome": outcome}, count)
+        for s in sources for outcome, count in s["cache"].items()
+    ])
+
+    metric("scrape_run_duration_seconds", "gauge", "Wall time of the whole run.",
+           [({}, report.get("duration_seconds", 0))])
+    metric("scrape_run_finished_timestamp_seconds", "gauge", "Unix time the run finished.",
+           [({}, report.get("finished_timestamp", 0))])
+    metric("scrape_run_jobs", "gauge", "Jobs saved in the run by outcome.", [
+        ({"outcome": key}, value) for key, value in report.get("stats", {}).items()
+    ])
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_textfile(report: dict, path: str) -> None:
+    """Write the run report as a Prometheus textfile (*.prom)."""
+    try:
+        _write_atomic(path, format_prometheus(report))
+        logger.info(f"Prometheus metrics written to {path}")
+    except OSError as e:
+        logger.warning(f"Could not write Prometheus metrics {path}: {e}")
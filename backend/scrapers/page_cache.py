@@ -0,0 +1,123 @@
+"""
+Persistent cache of HTTP validators and parsed listings, keyed by URL.
+
+For every listing page or API endpoint scraped through
+BaseScraper.scrape_page / scrape_json we keep the ETag and Last-Modified
+validators together with the JobListings parsed from the response. The next
+run sends If-None-Match / If-Modified-Since and, on a 304, reuses the cached
+listings without downloading or parsing the page again. For servers that
+ignore validators, a hash of the response body is compared instead, so a
+byte-identical page is still never parsed twice.
+
+Entries record the CACHE_VERSION they were parsed under; bump it whenever
+parsing changes (selectors, date or URL handling), so listings parsed by the
+old code are not replayed.
+
+Configuration (environment):
+    SCRAPER_CACHE_DIR      directory for scraper state files (default backend/.cache)
+    SCRAPER_CACHE_MAX_AGE  hours before an entry is refetched unconditionally (default 168)
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = os.getenv(
+    "SCRAPER_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"),
+)
+CACHE_MAX_AGE = float(os.getenv("SCRAPER_CACHE_MAX_AGE", "168")) * 3600
+
+# Version of the parsers that produced cached listings (entries written
+# before versioning count as 0)
+CACHE_VERSION = 1
+
+
+@dataclass
+class CacheEntry:
+    """Validators and parsed listings stored for one URL."""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    content_hash: Optional[str] = None
+    jobs: list[dict] = field(default_factory=list)
+    stored_at: float = field(default_factory=time.time)
+    version: int = CACHE_VERSION
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.version == CACHE_VERSION and time.time() - self.stored_at < CACHE_MAX_AGE
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that let the server answer 304 Not Modified."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def content_hash(body: bytes) -> str:
+    """Fingerprint of a response body."""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+class PageCache:
+    """JSON-file backed map of URL -> CacheEntry."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._entries: Optional[dict[str, CacheEntry]] = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, CacheEntry]:
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, CacheEntry]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+            return {url: CacheEntry(**{"version": 0, **entry}) for url, entry in raw.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable page cache {self.path}: {e}")
+            return {}
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the cached entry for a URL if it has not expired or been outdated."""
+        entry = self.entries.get(url)
+        if entry and entry.is_fresh:
+            return entry
+        return None
+
+    def put(self, url: str, entry: CacheEntry) -> None:
+        self.entries[url] = entry
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache back to disk, dropping expired entries."""
+        if not self._dirty:
+            return
+        entries = {url: asdict(e) for url, e in self.entries.items() if e.is_fresh}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save page cache {self.path}: {e}")
+
+
+# Process-wide cache shared by every scraper
+page_cache = PageCache(os.path.join(CACHE_DIR, "page_cache.json"))
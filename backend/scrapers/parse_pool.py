@@ -0,0 +1,88 @@
+"""
+Optional process pool for CPU-bound HTML parsing.
+
+Building a BeautifulSoup tree and walking its selectors blocks the event
+loop, so one large page (A2I, LinkedIn) stalls every other in-flight fetch.
+Scrapers that set PARSE_IN_PROCESS = True have their listing pages parsed in
+a worker process instead: the raw response bytes and the name of the parse
+method are shipped to the pool and plain JobListing dicts come back.
+
+Parse methods run in the worker on an instance created without __init__
+(no HTTP client), so they may only use class attributes and pure helpers.
+
+Configuration (environment):
+    SCRAPER_PARSE_WORKERS  worker processes for parsing (default 0 = parse in the event loop)
+"""
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Optional
+
+from .soup import make_soup
+
+logger = logging.getLogger(__name__)
+
+PARSE_WORKERS = int(os.getenv("SCRAPER_PARSE_WORKERS", "0"))
+
+_executor: Optional[ProcessPoolExecutor] = None
+
+
+def get_parse_executor() -> Optional[ProcessPoolExecutor]:
+    """Return the shared parse pool, or None if process parsing is disabled."""
+    global _executor
+    if PARSE_WORKERS <= 0:
+        return None
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PARSE_WORKERS)
+    return _executor
+
+
+def shutdown_parse_executor() -> None:
+    """Stop the worker processes (called at the end of a run)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _parse_in_worker(
+    scraper_class: type,
+    method_name: str,
+    body: bytes,
+    encoding: Optional[str],
+    args: tuple,
+) -> list[dict]:
+    """Worker entry point: parse a page with a scraper method and return job dicts."""
+    scraper = scraper_class.__new__(scraper_class)
+    soup = make_soup(body, encoding, scraper_class.PARSE_ONLY, scraper_class.PARSE_ROOTS)
+    return [job.to_dict() for job in getattr(scraper, method_name)(soup, *args)]
+
+
+async def parse_in_process(
+    scraper_class: type,
+    method_name: str,
+    body: bytes,
+    encoding: Optional[str] = None,
+    args: tuple = (),
+) -> Optional[list[dict]]:
+    """
+    Run `scraper_class.<method_name>(soup, *args)` in the parse pool.
+    Returns None if the pool is disabled or broken, so the caller can
+    parse in-process instead.
+    """
+    executor = get_parse_executor()
+    if executor is None:
+        return None
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(
+            executor,
+            partial(_parse_in_worker, scraper_class, method_name, body, encoding, args),
+        )
+    except BrokenProcessPool as e:
+        logger.warning(f"Parse pool unavailable, parsing in-process: {e}")
+        shutdown_parse_executor()
+        return None
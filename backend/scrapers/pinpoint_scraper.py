@@ -0,0 +1,141 @@
+"""
+Adapter for job boards hosted on Pinpoint (<company>.pinpointhq.com).
+
+Strategies: the postings.json API, then the rendered job board HTML.
+"""
+from .ats_scraper import ATSScraper, Strategy
+from .base_scraper import JobListing
+from .dedupe import unique_jobs
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PinpointScraper(ATSScraper):
+    """Base scraper for Pinpoint job boards."""
+
+    # Board root, e.g. https://enosisbd.pinpointhq.com
+    BASE_URL: str = ""
+    DEFAULT_LOCATION: str = "Dhaka, Bangladesh"
+    TAGS: list[str] = []
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.BASE_URL}/postings.json"
+
+    def strategies(self) -> list[tuple[str, Strategy]]:
+        return [("api", self._scrape_api), ("html", self._scrape_html)]
+
+    async def _scrape_api(self) -> list[JobListing]:
+        """Try to scrape from Pinpoint API."""
+        jobs = await self.scrape_json(self.api_url, self._parse_api)
+        return jobs or []
+
+    def _parse_api(self, data) -> list[JobListing]:
+        """Parse the Pinpoint API response."""
+        jobs = []
+        try:
+            if not data:
+                return jobs
+
+            postings = data if isinstance(data, list) else data.get("data", [])
+
+            for posting in postings:
+                if isinstance(posting, dict):
+                    job = JobListing(
+                        company=self.COMPANY_NAME,
+                        title=posting.get("title", ""),
+                        url=f"{self.BASE_URL}/postings/{posting.get('id', '')}",
+                        description=posting.get("description", ""),
+                        location=posting.get("location", {}).get("name", self.DEFAULT_LOCATION),
+                        job_type=posting.get("employment_type", "Full-time"),
+                        experience_level=self.extract_experience_level(
+                            posting.get("title", ""),
+                            posting.get("description", "")
+                        ),
+                        tags=list(self.TAGS),
+                    )
+                    jobs.append(job)
+
+        except Exception as e:
+            logger.debug(f"API scraping failed: {e}")
+
+        return jobs
+
+    async def _scrape_html(self) -> list[JobListing]:
+        """Fallback: parse the rendered job board."""
+        soup = await self.fetch_page(self.CAREER_URL)
+        if not soup:
+            logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
+            return []
+        return self._parse_board(soup)
+
+    def _parse_board(self, soup) -> list[JobListing]:
+        """Parse job listings from the Pinpoint board HTML."""
+        jobs = []
+
+        try:
+            # Pinpoint job board structure
+            job_cards = soup.select(
+                ".posting, .job-posting, .position, "
+                "[data-posting], .vacancy-item"
+            )
+
+            if not job_cards:
+                # Try alternative: look for job links
+                job_links = soup.select("a[href*='/postings/'], a[href*='jobs']")
+
+                for link in job_links:
+                    href = link.get("href", "")
+                    title = link.get_text(strip=True)
+
+                    if not href.startswith("http"):
+                        href = f"{self.BASE_URL}{href}"
+
+                    if not title or len(title) < 3:
+                        continue
+
+                    job = JobListing(
+                        company=self.COMPANY_NAME,
+                        title=title,
+                        url=href,
+                        location=self.DEFAULT_LOCATION,
+                        experience_level=self.extract_experience_level(title),
+                        tags=list(self.TAGS),
+                    )
+                    jobs.append(job)
+            else:
+                for card in job_cards:
+                    try:
+                        title_elem = card.select_one(".posting-title, h2, h3, a")
+                        title = title_elem.get_text(strip=True) if title_elem else ""
+
+                        link = card.select_one("a") or card
+                        url = ""
+                        if hasattr(link, 'get'):
+                            url = link.get("href", "")
+                            if url and not url.startswith("http"):
+                                url = f"{self.BASE_URL}{url}"
+
+                        dept_elem = card.select_one(".department, .team")
+                        department = dept_elem.get_text(strip=True) if dept_elem else ""
+
+                        if title and url:
+                            job = JobListing(
+                                company=self.COMPANY_NAME,
+                                title=title,
+                                url=url,
+                                location=self.DEFAULT_LOCATION,
+                                experience_level=self.extract_experience_level(title),
+                                tags=[*self.TAGS, department] if department else list(self.TAGS),
+                            )
+                            jobs.append(job)
+
+                    except Exception as e:
+                        logger.error(f"Error parsing job card: {e}")
+                        continue
+
+        except Exception as e:
+            logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
+
+        return unique_jobs(jobs)
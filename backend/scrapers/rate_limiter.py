@@ -0,0 +1,192 @@
+"""
+Per-host rate limiting shared by all scrapers.
+
+Every request made through BaseScraper takes a token from the bucket of the
+host it targets. Hosts are grouped by domain suffix, so e.g. all
+*.hire.trakstar.com boards (Kaz, Therap) share a single bucket.
+
+Configuration (environment):
+    SCRAPER_RATE         default requests per second per host (default 2)
+    SCRAPER_BURST        default bucket size per host (default 4)
+    SCRAPER_HOST_LIMITS  per-host overrides, e.g.
+                         "hire.trakstar.com=1/2,linkedin.com=0.5/1"
+                         (rate/burst; burst is optional)
+"""
+import asyncio
+import logging
+import os
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Statuses that signal the host wants us to slow down
+BACKOFF_STATUSES = {429, 503}
+
+# Built-in per-host limits (requests/second, burst)
+DEFAULT_HOST_LIMITS: dict[str, tuple[float, int]] = {
+    "hire.trakstar.com": (1.0, 2),
+    "linkedin.com": (0.5, 2),
+    "myworkdayjobs.com": (2.0, 4),
+    "bb.org.bd": (1.0, 2),
+}
+
+
+class TokenBucket:
+    """Token bucket with a backoff window for one host group."""
+
+    BASE_BACKOFF = 2.0
+    MAX_BACKOFF = 60.0
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _loop_lock(self) -> asyncio.Lock:
+        """
+        The lock for the running event loop. The bucket outlives a scraper
+        run (asyncio.run), but a lock cannot be shared across loops, so a
+        new one is made per loop; tokens and backoff carry over.
+        """
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._loop_lock():
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    await asyncio.sleep(self.blocked_until - now)
+                    continue
+
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def back_off(self, retry_after: Optional[float] = None) -> float:
+        """Block the bucket after a 429/503 and return the delay applied."""
+        self.strikes += 1
+        delay = retry_after
+        if delay is None:
+            delay = self.BASE_BACKOFF * 2 ** (self.strikes - 1)
+        delay = min(max(delay, 0.0), self.MAX_BACKOFF)
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        self.tokens = 0.0
+        return delay
+
+    def succeeded(self) -> None:
+        """Reset the backoff after a successful response."""
+        self.strikes = 0
+
+
+class HostRateLimiter:
+    """Registry of token buckets keyed by host group."""
+
+    def __init__(
+        self,
+        default_rate: float = 2.0,
+        default_burst: int = 4,
+        host_limits: Optional[dict[str, tuple[float, int]]] = None,
+    ):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(host_limits or {})
+        self._buckets: dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_env(cls) -> "HostRateLimiter":
+        """Build a limiter from SCRAPER_RATE / SCRAPER_BURST / SCRAPER_HOST_LIMITS."""
+        rate = float(os.getenv("SCRAPER_RATE", "2"))
+        burst = int(os.getenv("SCRAPER_BURST", "4"))
+        limits = dict(DEFAULT_HOST_LIMITS)
+        limits.update(parse_host_limits(os.getenv("SCRAPER_HOST_LIMITS", ""), burst))
+        return cls(default_rate=rate, default_burst=burst, host_limits=limits)
+
+    def configure(self, host: str, rate: float, burst: Optional[int] = None) -> None:
+        """Set the rate and burst for a host (or domain suffix)."""
+        host = host.lower()
+        self.host_limits[host] = (rate, burst or self.default_burst)
+        self._buckets.pop(host, None)
+
+    def host_key(self, url: str) -> str:
+        """Map a URL to the host group its bucket is keyed on."""
+        host = (urlsplit(url).hostname or "").lower()
+        for suffix in self.host_limits:
+            if host == suffix or host.endswith(f".{suffix}"):
+                return suffix
+        return host
+
+    def bucket(self, url: str) -> TokenBucket:
+        key = self.host_key(url)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.host_limits.get(key, (self.default_rate, self.default_burst))
+            bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    async def acquire(self, url: str) -> None:
+        """Wait for permission to send a request to the URL's host."""
+        await self.bucket(url).acquire()
+
+    def observe(self, url: str, status_code: int, retry_after: Optional[str] = None) -> None:
+        """Feed a response status back so the host's bucket can back off."""
+        bucket = self.bucket(url)
+        if status_code in BACKOFF_STATUSES:
+            delay = bucket.back_off(parse_retry_after(retry_after))
+            logger.warning(
+                f"{self.host_key(url)} returned {status_code}, backing off for {delay:.1f}s"
+            )
+        else:
+            bucket.succeeded()
+
+
+def parse_host_limits(spec: str, default_burst: int) -> dict[str, tuple[float, int]]:
+    """Parse "host=rate/burst,host=rate" into a limits mapping."""
+    limits = {}
+    for entry in spec.split(","):
+        if "=" not in entry:
+            continue
+        host, _, value = entry.partition("=")
+        rate, _, burst = value.partition("/")
+        try:
+            limits[host.strip().lower()] = (
+                float(rate),
+                int(burst) if burst.strip() else default_burst,
+            )
+        except ValueError:
+            logger.warning(f"Ignoring invalid SCRAPER_HOST_LIMITS entry: {entry!r}")
+    return limits
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+# Process-wide limiter shared by every scraper
+rate_limiter = HostRateLimiter.from_env()
@@ -0,0 +1,135 @@
+"""
+Persistent index of job URLs whose detail pages have already been fetched.
+
+Scrapers that enrich listings from per-job detail pages consult this index
+and only fetch details for URLs that are new, whose listing changed (a
+different fingerprint) or whose last fetch is older than the TTL. Jobs that
+are skipped reach the database without description/requirements, and the
+upsert keeps the stored values for those columns.
+
+The index is kept in the scraper cache directory and seeded at the start of
+each run from the jobs table, so a missing cache file does not cause every
+known job to be fetched again.
+
+Configuration (environment):
+    SCRAPER_DETAIL_TTL  days before a job's detail page is fetched again (default 7)
+"""
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from .dedupe import canonicalize_url
+from .page_cache import CACHE_DIR
+
+if TYPE_CHECKING:
+    from .base_scraper import JobListing
+
+logger = logging.getLogger(__name__)
+
+DETAIL_TTL = float(os.getenv("SCRAPER_DETAIL_TTL", "7")) * 86400
+
+# Entries untouched for this long belong to jobs that are gone
+PRUNE_AFTER = DETAIL_TTL * 4
+
+
+@dataclass
+class SeenEntry:
+    """Listing fingerprint and time of the last successful detail fetch."""
+    fingerprint: Optional[str]
+    fetched_at: float
+
+
+def listing_fingerprint(job: "JobListing") -> str:
+    """Fingerprint of the listing fields a detail page is fetched for."""
+    deadline = job.deadline.isoformat() if job.deadline else ""
+    key = "\x1f".join([job.title, job.location or "", job.job_type or "", deadline])
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class SeenIndex:
+    """JSON-file backed map of canonical URL -> SeenEntry."""
+
+    def __init__(self, path: str, ttl: float = DETAIL_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._entries: Optional[dict[str, SeenEntry]] = None
+        self._dirty = False
+
+    @property
+    def entries(self) -> dict[str, SeenEntry]:
+        if self._entries is None:
+            self._entries = self._load()
+        return self._entries
+
+    def _load(self) -> dict[str, SeenEntry]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                raw = json.load(f)
+            return {url: SeenEntry(**entry) for url, entry in raw.items()}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable seen-URL index {self.path}: {e}")
+            return {}
+
+    def seed(self, rows: Iterable[tuple[str, Optional[datetime]]]) -> int:
+        """
+        Add (url, fetched_at) pairs for jobs already stored with details.
+        URLs the index already knows are left alone. Returns the number added.
+        """
+        added = 0
+        for url, fetched_at in rows:
+            if url in self.entries:
+                continue
+            timestamp = fetched_at.timestamp() if fetched_at else 0.0
+            self.entries[url] = SeenEntry(fingerprint=None, fetched_at=timestamp)
+            added += 1
+        if added:
+            self._dirty = True
+        return added
+
+    def needs_fetch(self, job: "JobListing") -> bool:
+        """True if the job's detail page is new, changed or stale."""
+        entry = self.entries.get(canonicalize_url(job.url))
+        if entry is None:
+            return True
+        if time.time() - entry.fetched_at >= self.ttl:
+            return True
+        # Seeded entries have no fingerprint yet; trust them until the TTL
+        return entry.fingerprint is not None and entry.fingerprint != listing_fingerprint(job)
+
+    def mark_fetched(self, job: "JobListing", fingerprint: Optional[str] = None) -> None:
+        """
+        Record a successful detail fetch. Pass the fingerprint taken before the
+        detail page modified the listing, if it can change listing fields.
+        """
+        self.entries[canonicalize_url(job.url)] = SeenEntry(
+            fingerprint=fingerprint or listing_fingerprint(job),
+            fetched_at=time.time(),
+        )
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the index back to disk, dropping long-unseen entries."""
+        if not self._dirty:
+            return
+        cutoff = time.time() - max(PRUNE_AFTER, self.ttl)
+        entries = {url: asdict(e) for url, e in self.entries.items() if e.fetched_at >= cutoff}
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Could not save seen-URL index {self.path}: {e}")
+
+
+# Process-wide index shared by every scraper
+seen_index = SeenIndex(os.path.join(CACHE_DIR, "seen_urls.json"))
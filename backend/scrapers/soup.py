@@ -0,0 +1,63 @@
+"""
+Building BeautifulSoup trees from raw response bytes.
+
+Pages are parsed from the undecoded body, so lxml detects the encoding
+(HTTP charset, then <meta charset>) without first building a full Python
+str copy of the page. A parse can also be scoped to the part of the page a
+scraper actually reads:
+
+    parse_only  a bs4 SoupStrainer; only matching tags are added to the tree
+    roots       an XPath expression; the page is parsed once with lxml (C
+                speed) and only the matching subtrees are turned into soup
+"""
+import logging
+from typing import Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree, html as lxml_html
+
+logger = logging.getLogger(__name__)
+
+
+def make_soup(
+    content: bytes,
+    encoding: Optional[str] = None,
+    parse_only: Optional[SoupStrainer] = None,
+    roots: Optional[str] = None,
+) -> BeautifulSoup:
+    """Parse a response body, optionally limited to a strainer or XPath roots."""
+    if roots:
+        fragment = _extract_roots(content, encoding, roots)
+        if fragment is not None:
+            return BeautifulSoup(fragment, "lxml", parse_only=parse_only, from_encoding="utf-8")
+    return BeautifulSoup(content, "lxml", parse_only=parse_only, from_encoding=encoding)
+
+
+def _extract_roots(content: bytes, encoding: Optional[str], roots: str) -> Optional[bytes]:
+    """
+    Serialize the subtrees matching an XPath expression.
+    Nested matches are dropped so no element appears twice. Returns None if
+    the page cannot be parsed with lxml directly or nothing matches (e.g.
+    after a layout change); the caller then falls back to a full parse.
+    """
+    # libxml2 assumes Latin-1 for undeclared pages; modern pages are UTF-8
+    encoding = encoding or EncodingDetector.find_declared_encoding(content, is_html=True) or "utf-8"
+    try:
+        parser = lxml_html.HTMLParser(encoding=encoding)
+        tree = lxml_html.document_fromstring(content, parser=parser)
+        matches = tree.xpath(roots)
+    except (etree.ParserError, etree.XPathError, LookupError, ValueError) as e:
+        logger.debug(f"lxml fast path unavailable ({e}), parsing the whole page")
+        return None
+
+    elements = [m for m in matches if isinstance(m, etree._Element)]
+    selected = set(elements)
+    top_level = [
+        element for element in elements
+        if not any(ancestor in selected for ancestor in element.iterancestors())
+    ]
+    if not top_level:
+        logger.debug(f"No elements match {roots!r}, parsing the whole page")
+        return None
+    return b"".join(lxml_html.tostring(element, encoding="utf-8") for element in top_level)
@@ -0,0 +1,165 @@
+"""
+Adapter for job boards hosted on Trakstar Hire (<company>.hire.trakstar.com).
+
+Strategies: the openings JSON API, then the rendered job board HTML.
+"""
+from .ats_scraper import ATSScraper, Strategy
+from .base_scraper import JobListing
+from .dedupe import unique_jobs
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class TrakstarScraper(ATSScraper):
+    """Base scraper for Trakstar Hire job boards."""
+
+    # Board root, e.g. https://kazsoftware.hire.trakstar.com
+    BASE_URL: str = ""
+    DEFAULT_LOCATION: str = "Dhaka, Bangladesh"
+    TAGS: list[str] = []
+
+    @property
+    def api_url(self) -> str:
+        return f"{self.BASE_URL}/api/v1/openings"
+
+    def strategies(self) -> list[tuple[str, Strategy]]:
+        return [("api", self._scrape_api), ("html", self._scrape_html)]
+
+    async def _scrape_api(self) -> list[JobListing]:
+        """Try to scrape from Trakstar API."""
+        jobs = await self.scrape_json(self.api_url, self._parse_api)
+        return jobs or []
+
+    def _parse_api(self, data) -> list[JobListing]:
+        """Parse the Trakstar API response."""
+        jobs = []
+        try:
+            if not data:
+                return jobs
+
+            openings = data.get("openings", data) if isinstance(data, dict) else data
+
+            for opening in openings:
+                if isinstance(opening, dict):
+                    job = JobListing(
+                        company=self.COMPANY_NAME,
+                        title=opening.get("title", ""),
+                        url=opening.get("url", self.CAREER_URL),
+                        description=opening.get("description", ""),
+                        location=opening.get("location", self.DEFAULT_LOCATION),
+                        job_type=opening.get("employment_type", "Full-time"),
+                        experience_level=self.extract_experience_level(
+                            opening.get("title", ""),
+                            opening.get("description", "")
+                        ),
+                        tags=list(self.TAGS),
+                    )
+                    jobs.append(job)
+
+        except Exception as e:
+            logger.debug(f"API scraping failed: {e}")
+
+        return jobs
+
+    async def _scrape_html(self) -> list[JobListing]:
+        """Fallback: parse the rendered job board."""
+        soup = await self.fetch_page(self.CAREER_URL)
+        if not soup:
+            logger.error(f"Failed to fetch {self.COMPANY_NAME} career page")
+            return []
+        return self._parse_board(soup)
+
+    def _parse_board(self, soup) -> list[JobListing]:
+        """Parse job listings from the Trakstar board HTML."""
+        jobs = []
+
+        try:
+            # Trakstar job board structure
+            job_cards = soup.select(
+                ".opening, .job-opening, .position-listing, "
+                "[data-opening], .jobs-list li"
+            )
+
+            if not job_cards:
+                # Trakstar HTML: a[href*='jobs'] > div.row > div > h3 + div.location
+                job_links = soup.select("a[href*='jobs'], a[href*='opening']")
+
+                for link in job_links:
+                    href = link.get("href", "")
+
+                    # Extract title from h3 only (not full link text)
+                    title_elem = link.select_one(
+                        "h3.js-job-list-opening-name, h3, h4, .opening-title"
+                    )
+                    title = title_elem.get_text(strip=True) if title_elem else ""
+
+                    if not title or len(title) < 3:
+                        continue
+
+                    if not href.startswith("http"):
+                        href = f"{self.BASE_URL}{href}"
+
+                    # Extract location separately
+                    loc_elem = link.select_one(
+                        "div.js-job-list-opening-loc, .location, [class*='location']"
+                    )
+                    location = loc_elem.get_text(strip=True) if loc_elem else self.DEFAULT_LOCATION
+
+                    # Extract department
+                    dept_elem = link.select_one("div.rb-text-4")
+                    department = dept_elem.get_text(strip=True) if dept_elem else ""
+
+                    # Extract job type (specifically the meta div, not location meta spans)
+                    type_elem = link.select_one("div.js-job-list-opening-meta")
+                    job_type = type_elem.get_text(strip=True) if type_elem else "Full-time"
+
+                    tags = list(self.TAGS)
+                    if department:
+                        tags.append(department)
+
+                    job = JobListing(
+                        company=self.COMPANY_NAME,
+                        title=title,
+                        url=href,
+                        location=location,
+                        job_type=job_type,
+                        experience_level=self.extract_experience_level(title),
+                        tags=tags,
+                    )
+                    jobs.append(job)
+
+            else:
+                for card in job_cards:
+                    try:
+                        title_elem = card.select_one(".title, h2, h3, a")
+                        title = title_elem.get_text(strip=True) if title_elem else ""
+
+                        link = card.select_one("a")
+                        url = ""
+                        if link:
+                            url = link.get("href", "")
+                            if not url.startswith("http"):
+                                url = f"{self.BASE_URL}{url}"
+
+                        location_elem = card.select_one(".location")
+                        location = location_elem.get_text(strip=True) if location_elem else self.DEFAULT_LOCATION
+
+                        if title and url:
+                            job = JobListing(
+                                company=self.COMPANY_NAME,
+                                title=title,
+                                url=url,
+                                location=location,
+                                experience_level=self.extract_experience_level(title),
+                                tags=list(self.TAGS),
+                            )
+                            jobs.append(job)
+
+                    except Exception as e:
+                        logger.error(f"Error parsing job card: {e}")
+
+        except Exception as e:
+            logger.error(f"Error scraping {self.COMPANY_NAME}: {e}")
+
+        return unique_jobs(jobs)
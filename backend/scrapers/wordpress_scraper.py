@@ -0,0 +1,189 @@
+"""
+Adapter for career sites built on WordPress.
+
+Strategies, in priority order: each configured WP REST endpoint (the job
+post type differs per theme, e.g. job-listing / jobs / career), the rendered
+job page, and the theme's admin-ajax action.
+"""
+from .ats_scraper import ATSScraper, Strategy
+from .base_scraper import JobListing
+from .dedupe import unique_jobs
+from functools import partial
+import logging
+import json
+
+logger = logging.getLogger(__name__)
+
+
+class WordPressScraper(ATSScraper):
+    """Base scraper for WordPress career sites."""
+
+    # Site root, e.g. https://selisegroup.com
+    BASE_URL: str = ""
+    # REST routes (relative to BASE_URL) that may list job posts
+    WP_REST_ENDPOINTS: list[str] = ["/wp-json/wp/v2/jobs"]
+    # admin-ajax action returning {"data": [...]} (skipped if empty)
+    AJAX_ACTION: str = ""
+    # Path segment of job detail URLs on the rendered job page
+    JOB_PATH: str = "/job/"
+    # Slugs under JOB_PATH that are not job posts
+    EXCLUDED_SLUGS: set[str] = {""}
+    # Navigation texts that are not job titles
+    SKIP_TITLES: set[str] = set()
+    DEFAULT_LOCATION: str = "Dhaka, Bangladesh"
+    TAGS: list[str] = []
+
+    @property
+    def ajax_url(self) -> str:
+        return f"{self.BASE_URL}/wp-admin/admin-ajax.php"
+
+    def strategies(self) -> list[tuple[str, Strategy]]:
+        strategies: list[tuple[str, Strategy]] = [
+            (f"wp:{endpoint}", partial(self._try_wp_endpoint, endpoint))
+            for endpoint in self.WP_REST_ENDPOINTS
+        ]
+        strategies.append(("html", self._parse_job_page))
+        if self.AJAX_ACTION:
+            strategies.append(("ajax", self._try_ajax_endpoint))
+        return strategies
+
+    async def _try_wp_endpoint(self, endpoint: str) -> list[JobListing]:
+        """Try fetching jobs from one WordPress REST endpoint."""
+        jobs = await self.scrape_json(f"{self.BASE_URL}{endpoint}", self._parse_wp_items)
+        return jobs or []
+
+    def _parse_wp_items(self, data) -> list[JobListing]:
+        """Parse job posts returned by a WP REST endpoint."""
+        jobs = []
+        try:
+            if not data or not isinstance(data, list):
+                return jobs
+
+            for item in data:
+                title = item.get("title", {})
+                if isinstance(title, dict):
+                    title = title.get("rendered", "")
+                title = str(title).strip()
+
+                if not title or self._is_skip_title(title):
+                    continue
+
+                link = item.get("link", "")
+                if not link:
+                    continue
+
+                description = item.get("content", {})
+                if isinstance(description, dict):
+                    description = description.get("rendered", "")
+
+                job = JobListing(
+                    company=self.COMPANY_NAME,
+                    title=title,
+                    url=link,
+                    description=str(description).strip()[:2000] if description else None,
+                    location=self.DEFAULT_LOCATION,
+                    experience_level=self.extract_experience_level(title, str(description or "")),
+                    tags=list(self.TAGS),
+                )
+                jobs.append(job)
+
+        except Exception as e:
+            logger.debug(f"WP REST API not available: {e}")
+
+        return jobs
+
+    async def _parse_job_page(self) -> list[JobListing]:
+        """Parse the job page for actual job posting links."""
+        jobs = await self.scrape_page(self.CAREER_URL, self._parse_job_links)
+        return jobs or []
+
+    def _parse_job_links(self, soup) -> list[JobListing]:
+        """Collect job posting links from the job page."""
+        jobs = []
+
+        try:
+            for link in soup.select("a[href]"):
+                href = link.get("href", "").strip()
+                title = link.get_text(strip=True)
+
+                if not href or not self._is_valid_job_url(href):
+                    continue
+
+                if not title or self._is_skip_title(title):
+                    continue
+
+                if not href.startswith("http"):
+                    href = f"{self.BASE_URL}{href}"
+
+                job = JobListing(
+                    company=self.COMPANY_NAME,
+                    title=title,
+                    url=href,
+                    location=self.DEFAULT_LOCATION,
+                    experience_level=self.extract_experience_level(title),
+                    tags=list(self.TAGS),
+                )
+                jobs.append(job)
+
+        except Exception as e:
+            logger.error(f"Error parsing {self.COMPANY_NAME} job page: {e}")
+
+        return unique_jobs(jobs)
+
+    async def _try_ajax_endpoint(self) -> list[JobListing]:
+        """Try fetching jobs via WordPress AJAX."""
+        jobs = []
+        try:
+            response = await self.post(
+                self.ajax_url,
+                data={"action": self.AJAX_ACTION},
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+            )
+            if response.status_code == 200:
+                try:
+                    data = response.json()
+                    if isinstance(data, dict) and data.get("data"):
+                        for item in data["data"]:
+                            title = item.get("title", "").strip()
+                            url = item.get("url", "") or item.get("link", "")
+                            if title and url and not self._is_skip_title(title):
+                                job = JobListing(
+                                    company=self.COMPANY_NAME,
+                                    title=title,
+                                    url=url,
+                                    location=self.DEFAULT_LOCATION,
+                                    experience_level=self.extract_experience_level(title),
+                                    tags=list(self.TAGS),
+                                )
+                                jobs.append(job)
+                except (json.JSONDecodeError, ValueError):
+                    pass
+        except Exception as e:
+            logger.debug(f"AJAX endpoint not available: {e}")
+
+        return jobs
+
+    def _is_skip_title(self, title: str) -> bool:
+        """Check if the title is a navigation/non-job text."""
+        normalized = title.lower().strip()
+        if normalized in self.SKIP_TITLES:
+            return True
+        if len(normalized) < 8:
+            return True
+        if any(normalized.startswith(prefix) for prefix in [
+            "search ", "find ", "join ", "about ", "contact ", "our ",
+        ]):
+            return True
+        return False
+
+    def _is_valid_job_url(self, href: str) -> bool:
+        """Check if URL is an actual job posting, not navigation."""
+        if self.JOB_PATH not in href:
+            return False
+        parts = href.split(self.JOB_PATH)
+        if len(parts) < 2 or not parts[1].strip("/"):
+            return False
+        slug = parts[1].strip("/")
+        if slug in self.EXCLUDED_SLUGS:
+            return False
+        return True
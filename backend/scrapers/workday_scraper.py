@@ -0,0 +1,143 @@
+"""
+Generic scraper for career sites hosted on Workday.
+
+Workday job portals are fully JS-rendered, but they are backed by a JSON
+search API (POST .../wday/cxs/<tenant>/<site>/jobs). A search returns at most
+PAGE_SIZE postings per call together with the total number of matches, so
+the first page is fetched to learn the total and the remaining offset
+windows are then fetched concurrently.
+
+A tenant is added by subclassing and setting the configuration attributes:
+
+    class ExampleScraper(WorkdayScraper):
+        COMPANY_NAME = "Example"
+        CAREER_URL = "https://example.wd1.myworkdayjobs.com/Careers"
+        WORKDAY_API = "https://example.wd1.myworkdayjobs.com/wday/cxs/example/Careers/jobs"
+        APPLIED_FACETS = {"locationCountry": ["<country id>"]}
+        SEARCH_TEXT = "Bangladesh"
+"""
+from .base_scraper import BaseScraper, JobListing
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class WorkdayScraper(BaseScraper):
+    """Base scraper for Workday-hosted job portals."""
+
+    # Tenant search endpoint: https://<host>/wday/cxs/<tenant>/<site>/jobs
+    WORKDAY_API: str = ""
+    # Facet filter query (e.g. location country ids); skipped if empty
+    APPLIED_FACETS: dict[str, list[str]] = {}
+    # Keyword query run alongside the facet query; skipped if empty
+    SEARCH_TEXT: str = ""
+    # Workday returns at most 20 postings per request
+    PAGE_SIZE: int = 20
+    # Offset pages fetched at once per query (the host rate limit still applies)
+    PAGE_CONCURRENCY: int = 4
+    # Safety cap on postings read per query
+    MAX_RESULTS: int = 1000
+    DEFAULT_LOCATION: str = "Dhaka, Bangladesh"
+    TAGS: list[str] = []
+
+    HEADERS = {"Accept": "application/json"}
+
+    async def scrape(self) -> list[JobListing]:
+        """Run the facet and keyword queries in parallel and merge their postings."""
+        facet_postings, keyword_postings = await asyncio.gather(
+            self._query_workday_api(),
+            self._query_workday_keyword(),
+        )
+
+        # Merge by externalPath; the facet query's postings win
+        postings: dict[str, dict] = {}
+        for posting in facet_postings + keyword_postings:
+            key = posting.get("externalPath") or posting.get("title", "")
+            postings.setdefault(key, posting)
+
+        jobs = [job for job in map(self._parse_posting, postings.values()) if job]
+        if jobs:
+            logger.info(f"Found {len(jobs)} jobs at {self.COMPANY_NAME} via Workday API "
+                        f"({len(facet_postings)} by facet, {len(keyword_postings)} by keyword)")
+        else:
+            logger.warning(f"No jobs found for {self.COMPANY_NAME}")
+        return jobs
+
+    async def _query_workday_api(self) -> list[dict]:
+        """All postings matching APPLIED_FACETS."""
+        if not self.APPLIED_FACETS:
+            return []
+        return await self._search(self.APPLIED_FACETS, "")
+
+    async def _query_workday_keyword(self) -> list[dict]:
+        """All postings matching SEARCH_TEXT."""
+        if not self.SEARCH_TEXT:
+            return []
+        return await self._search({}, self.SEARCH_TEXT)
+
+    async def _search(self, facets: dict, search_text: str) -> list[dict]:
+        """
+        Read every page of a search. The first page gives the total; the
+        remaining offsets are fetched PAGE_CONCURRENCY at a time.
+        """
+        first = await self._fetch_page(facets, search_text, 0)
+        if first is None:
+            return []
+
+        postings = list(first.get("jobPostings", []))
+        total = min(first.get("total") or 0, self.MAX_RESULTS)
+        semaphore = asyncio.Semaphore(max(self.PAGE_CONCURRENCY, 1))
+
+        async def fetch(offset: int) -> Optional[dict]:
+            async with semaphore:
+                return await self._fetch_page(facets, search_text, offset)
+
+        pages = await asyncio.gather(
+            *(fetch(offset) for offset in range(self.PAGE_SIZE, total, self.PAGE_SIZE))
+        )
+        for page in pages:
+            if page:
+                postings.extend(page.get("jobPostings", []))
+
+        if len(postings) < total:
+            logger.warning(f"{self.COMPANY_NAME}: read {len(postings)} of {total} Workday postings")
+        return postings
+
+    async def _fetch_page(self, facets: dict, search_text: str, offset: int) -> Optional[dict]:
+        """POST one search page; returns the response JSON or None on failure."""
+        payload = {
+            "appliedFacets": facets,
+            "limit": self.PAGE_SIZE,
+            "offset": offset,
+            "searchText": search_text,
+        }
+        try:
+            response = await self.post(self.WORKDAY_API, json=payload)
+            if response.status_code != 200:
+                logger.debug(f"Workday API returned {response.status_code} at offset {offset}")
+                return None
+            with self.metrics.parsing():
+                return response.json()
+        except Exception as e:
+            logger.error(f"Error querying Workday API at offset {offset}: {e}")
+            return None
+
+    def _parse_posting(self, posting: dict) -> JobListing | None:
+        """Convert one Workday posting into a JobListing."""
+        title = (posting.get("title") or "").strip()
+        if not title:
+            return None
+
+        external_path = posting.get("externalPath", "")
+        url = f"{self.CAREER_URL}{external_path}" if external_path else self.CAREER_URL
+
+        return JobListing(
+            company=self.COMPANY_NAME,
+            title=title,
+            url=url,
+            location=posting.get("locationsText") or self.DEFAULT_LOCATION,
+            experience_level=self.extract_experience_level(title),
+            tags=list(self.TAGS),
+        )
@@ -1,38 +1,69 @@
-import { useState } from 'react'
-import { useQuery, keepPreviousData } from '@tanstack/react-query'
+import { useEffect, useRef, useState } from 'react'
+import { useQuery, useInfiniteQuery, keepPreviousData } from '@tanstack/react-query'
 import { Search, Filter, Briefcase, Loader2, AlertTriangle } from 'lucide-react'
 import { Link } from 'react-router-dom'
 import { jobsApi } from '../services/api'
 import JobCard from '../components/JobCard'
 import CompanyFilter from '../components/CompanyFilter'
 
+const PER_PAGE = 20
+
 function Jobs() {
   const [search, setSearch] = useState('')
   const [selectedCompany, setSelectedCompany] = useState<string | null>(null)
   const [selectedLevel, setSelectedLevel] = useState<string | null>(null)
-  const [page, setPage] = useState(1)
+  const loadMoreRef = useRef<HTMLDivElement>(null)
 
   const { data: companies } = useQuery({
     queryKey: ['companies'],
     queryFn: jobsApi.getCompanies,
   })
 
-  const { data: jobsData, isLoading, isFetching, isError } = useQuery({
-    queryKey: ['jobs', page, selectedCompany, selectedLevel, search],
-    queryFn: () => jobsApi.getJobs({
-      page,
-      per_page: 20,
+  // Pages are chained by the server's next_cursor (keyset pagination)
+  const {
+    data,
+    isLoading,
+    isFetching,
+    isError,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
+    queryKey: ['jobs', selectedCompany, selectedLevel, search],
+    queryFn: ({ pageParam }) => jobsApi.getJobs({
+      cursor: pageParam,
+      per_page: PER_PAGE,
       company: selectedCompany || undefined,
       experience_level: selectedLevel || undefined,
       search: search || undefined,
     }),
+    initialPageParam: undefined as string | undefined,
+    getNextPageParam: (lastPage) => lastPage.next_cursor ?? undefined,
     placeholderData: keepPreviousData,
     refetchInterval: (query) => query.state.status === 'error' ? 15000 : false,
   })
 
+  const jobs = data?.pages.flatMap((page) => page.jobs) ?? []
+  const firstPage = data?.pages[0]
+
+  // Load the next page when the sentinel below the list scrolls into view
+  useEffect(() => {
+    const sentinel = loadMoreRef.current
+    if (!sentinel || !hasNextPage) return
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries[0].isIntersecting && !isFetchingNextPage) {
+          fetchNextPage()
+        }
+      },
+      { rootMargin: '400px' },
+    )
+    observer.observe(sentinel)
+    return () => observer.disconnect()
+  }, [hasNextPage, isFetchingNextPage, fetchNextPage])
+
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault()
-    setPage(1)
   }
 
   const experienceLevels = ['Senior', 'Mid-Level', 'Junior', 'Intern']
@@ -80,10 +111,7 @@ function Jobs() {
             <CompanyFilter
               companies={companies}
               selectedCompany={selectedCompany}
-              onSelect={(company) => {
-                setSelectedCompany(company)
-                setPage(1)
-              }}
+              onSelect={(company) => setSelectedCompany(company)}
             />
           )}
         </div>
@@ -92,10 +120,7 @@ function Jobs() {
           <span className="text-sm font-medium text-gray-700 mb-2 block">Experience Level</span>
           <div className="flex flex-wrap gap-2">
             <button
-              onClick={() => {
-                setSelectedLevel(null)
-                setPage(1)
-              }}
+              onClick={() => setSelectedLevel(null)}
               className={`px-3 py-1.5 rounded-full text-sm font-medium transition-colors ${
                 selectedLevel === null
                   ? 'bg-primary-600 text-white'
@@ -107,10 +132,7 @@ function Jobs() {
             {experienceLevels.map((level) => (
               <button
                 key={level}
-                onClick={() => {
-                  setSelectedLevel(level)
-                  setPage(1)
-                }}
+                onClick={() => setSelectedLevel(level)}
                 className={`px-3 py-1.5 rounded-full text-sm font-medium transition-colors ${
                   selectedLevel === level
                     ? 'bg-primary-600 text-white'
@@ -127,15 +149,15 @@ function Jobs() {
       {/* Results Count */}
       <div className="flex items-center justify-between mb-4">
         <p className="text-sm text-gray-500">
-          {jobsData ? (
+          {firstPage ? (
             <>
-              Showing {((page - 1) * 20) + 1}-{Math.min(page * 20, jobsData.total)} of {jobsData.total} opportunities
+              Showing {jobs.length} of {firstPage.total_exact ? '' : 'about '}{firstPage.total} opportunities
             </>
           ) : (
             'Loading...'
           )}
         </p>
-        {isFetching && !isLoading && (
+        {isFetching && !isLoading && !isFetchingNextPage && (
           <Loader2 className="w-4 h-4 text-primary-600 animate-spin" />
         )}
       </div>
@@ -157,9 +179,9 @@ function Jobs() {
             </div>
           ))}
         </div>
-      ) : jobsData?.jobs && jobsData.jobs.length > 0 ? (
+      ) : jobs.length > 0 ? (
         <div className="space-y-4">
-          {jobsData.jobs.map((job) => (
+          {jobs.map((job) => (
             <JobCard key={job.id} job={job} />
           ))}
         </div>
@@ -172,7 +194,6 @@ function Jobs() {
               setSearch('')
               setSelectedCompany(null)
               setSelectedLevel(null)
-              setPage(1)
             }}
             className="mt-3 text-primary-600 hover:text-primary-700 text-sm font-medium"
           >
@@ -181,25 +202,16 @@ function Jobs() {
         </div>
       )}
 
-      {/* Pagination */}
-      {jobsData && jobsData.total_pages > 1 && (
-        <div className="flex items-center justify-center gap-2 mt-8">
-          <button
-            onClick={() => setPage(Math.max(1, page - 1))}
-            disabled={page === 1}
-            className="px-4 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
-          >
-            Previous
-          </button>
-          <span className="px-4 py-2 text-sm text-gray-600">
-            Page {page} of {jobsData.total_pages}
-          </span>
+      {/* Infinite scroll */}
+      {hasNextPage && (
+        <div ref={loadMoreRef} className="flex justify-center mt-8">
           <button
-            onClick={() => setPage(Math.min(jobsData.total_pages, page + 1))}
-            disabled={page === jobsData.total_pages}
-            className="px-4 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+            className="px-4 py-2 rounded-lg border border-gray-300 text-gray-700 hover:bg-gray-50 disabled:opacity-50 disabled:cursor-not-allowed flex items-center gap-2"
           >
-            Next
+            {isFetchingNextPage && <Loader2 className="w-4 h-4 animate-spin" />}
+            {isFetchingNextPage ? 'Loading...' : 'Load more'}
           </button>
         </div>
       )}
@@ -28,14 +28,17 @@ export interface Job {
   is_active: boolean
   created_at: string
   updated_at: string
+  snippet?: string | null
 }
 
 export interface JobListResponse {
   jobs: Job[]
-  total: number
+  total: number | null
   page: number
   per_page: number
-  total_pages: number
+  total_pages: number | null
+  next_cursor?: string | null
+  total_exact: boolean
 }
 
 export interface Company {
@@ -47,6 +50,8 @@ export interface JobStats {
   total_jobs: number
   by_company: Record<string, number>
   by_experience_level: Record<string, number>
+  by_job_type: Record<string, number>
+  by_tag: Record<string, number>
 }
 
 export interface Subscription {
@@ -64,8 +69,11 @@ export const jobsApi = {
   getJobs: async (params: {
     page?: number
     per_page?: number
+    cursor?: string
+    include_total?: boolean
     company?: string
     search?: string
+    highlight?: boolean
     experience_level?: string
     job_type?: string
   }): Promise<JobListResponse> => {